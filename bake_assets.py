@@ -0,0 +1,7 @@
+"""Bake the pre-scaled startup images for Mind of Seasons (see src/utils/asset_bake.py)."""
+
+from src.utils.asset_bake import bake_assets, get_bake_dir
+
+if __name__ == "__main__":
+    baked = bake_assets()
+    print(f"Baked {baked} image variants into {get_bake_dir()}")
@@ -0,0 +1,99 @@
+"""
+Startup benchmark for Mind of Seasons.
+
+Runs `main.py --benchmark-startup` several times (the game exits as soon as
+the main menu is ready) and reports wall-clock time plus the in-game marks:
+display opened, first frame shown, main menu ready. With --importtime the
+slowest imports from `python -X importtime` are listed too.
+
+Usage:
+    python benchmark_startup.py [--runs 5] [--target 2.0] [--importtime] [--headless]
+
+Exits with status 1 when the median wall-clock time is above --target.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_once(env, importtime=False):
+    """Start the game once; return (wall seconds, marks dict, stderr)."""
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["main.py", "--benchmark-startup"]
+
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+
+    marks = {}
+    for line in result.stdout.splitlines():
+        if line.startswith("STARTUP "):
+            marks = json.loads(line[len("STARTUP "):])
+    if not marks:
+        raise RuntimeError(f"Game did not report startup marks:\n{result.stdout}\n{result.stderr}")
+    return wall, marks, result.stderr
+
+
+def slowest_imports(stderr, count=15):
+    """Parse -X importtime output into the (cumulative us, module) pairs that took longest."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, rest = line.partition(":")
+        self_us, cumulative_us, name = rest.split("|", 2)
+        imports.append((int(cumulative_us), name.rstrip()))
+    imports.sort(reverse=True)
+    return imports[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="number of runs (default 5)")
+    parser.add_argument("--target", type=float, default=2.0, help="median wall-clock target in seconds")
+    parser.add_argument("--importtime", action="store_true", help="also list the slowest imports")
+    parser.add_argument("--headless", action="store_true", help="use SDL dummy video/audio drivers")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.headless:
+        env.setdefault("SDL_VIDEODRIVER", "dummy")
+        env.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    walls = []
+    all_marks = []
+    for _ in range(args.runs):
+        wall, marks, _ = run_once(env)
+        walls.append(wall)
+        all_marks.append(marks)
+
+    print(f"Startup over {args.runs} runs (median):")
+    print(f"  wall clock   {statistics.median(walls):7.3f}s")
+    for name in all_marks[0]:
+        value = statistics.median(marks[name] for marks in all_marks)
+        print(f"  {name:<12} {value:7.3f}s  (after imports)")
+
+    if args.importtime:
+        _, _, stderr = run_once(env, importtime=True)
+        print("\nSlowest imports (cumulative):")
+        for cumulative_us, name in slowest_imports(stderr):
+            print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    median_wall = statistics.median(walls)
+    if median_wall > args.target:
+        print(f"\nFAIL: median {median_wall:.3f}s is over the {args.target:.3f}s target")
+        sys.exit(1)
+    print(f"\nOK: median {median_wall:.3f}s is within the {args.target:.3f}s target")
+
+
+if __name__ == "__main__":
+    main()
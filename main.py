@@ -1,4 +1,5 @@
 import pygame
+import json
 import time
 import sys
 from src.world import map_initialization, Background, calculate_camera_offset, Cabin
@@ -6,10 +7,16 @@ from src.entities import Player, Npc, EnemyManager
 from src.ui import (
     Inventory, LoreDisplay, CATS_LORE, COLLECTIBLES_LORE, GameOverScreen,
     LoadingScreen, MainMenu, PauseMenu, OptionsMenu, CreditsScreen, GAME_TITLE,
-    TutorialSystem, Minimap
+    TutorialSystem, Minimap, WorldMap
+)
+from src.utils import (
+    AssetPreloader, AllocationTracker, clear_all_caches, reconvert_images, open_asset, set_cache_budget,
+    get_font_report
+)
+from src.save_system import (
+    save_game_async, process_save_results, wait_for_saves, AutosaveScheduler, SaveJournal,
+    load_game, load_settings, save_settings, delete_save, get_save_dir
 )
-from src.utils import preload_all_assets, clear_all_caches, resource_path
-from src.save_system import save_game, load_game, load_settings, save_settings, delete_save, get_save_dir
 from src.audio import MusicManager
 from src.config import TILE_SIZE, MAP_WIDTH, MAP_HEIGHT
 
@@ -25,11 +32,22 @@ class GameState:
     GAME_OVER = "game_over"
 
 
-# Initialize Pygame
-pygame.init()
+# Startup timing (python main.py --benchmark-startup, see benchmark_startup.py)
+STARTUP_BENCHMARK = '--benchmark-startup' in sys.argv
+startup_start = time.perf_counter()
+startup_marks = {}
+
+# Initialize only the pygame subsystems the game uses
+pygame.display.init()
+pygame.font.init()
+try:
+    pygame.mixer.init()
+except pygame.error as e:
+    print(f"Warning: Could not initialize audio: {e}")
 
 # Load settings and set display mode
 settings = load_settings()
+set_cache_budget(settings.get('asset_cache_budget_mb', 64) * 1024 * 1024)
 if settings.get('fullscreen', True):
     screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
 else:
@@ -41,10 +59,28 @@ pygame.display.set_caption(GAME_TITLE)
 
 # Set window icon
 try:
-    icon = pygame.image.load(resource_path('graphics/character/character_idle.png'))
+    icon = pygame.image.load(open_asset('graphics/character/character_idle.png'), 'character_idle.png')
     pygame.display.set_icon(icon)
 except Exception:
     pass  # Icon not critical
+startup_marks['display'] = time.perf_counter() - startup_start
+
+# Surface allocation tracker (python main.py --alloc-debug, F3 toggles the overlay)
+alloc_tracker = None
+if '--alloc-debug' in sys.argv:
+    alloc_tracker = AllocationTracker(get_save_dir().parent / 'alloc_log.jsonl')
+    alloc_tracker.enable()
+    print(f"Logging surface allocations to {alloc_tracker.log_path}")
+
+# Show the loading screen right away, before building everything else
+loading_screen = LoadingScreen(SCREEN_WIDTH, SCREEN_HEIGHT)
+loading_screen.draw(screen)
+pygame.display.flip()
+startup_marks['first_frame'] = time.perf_counter() - startup_start
+
+# Autosave (delta checkpoints in the background while playing)
+autosave = AutosaveScheduler(settings.get('autosave_interval', 30))
+journal = SaveJournal()
 
 # Music
 music_manager = MusicManager()
@@ -62,7 +98,6 @@ play_time = 0
 play_time_start = 0
 
 # UI screens (persistent)
-loading_screen = LoadingScreen(SCREEN_WIDTH, SCREEN_HEIGHT)
 main_menu = MainMenu(SCREEN_WIDTH, SCREEN_HEIGHT)
 pause_menu = PauseMenu(SCREEN_WIDTH, SCREEN_HEIGHT)
 options_menu = OptionsMenu(SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -80,6 +115,7 @@ enemy_manager = None
 spawn_point = None
 tutorial = None
 minimap = None
+world_map = None
 
 # Input and collection state
 class InputState:
@@ -94,6 +130,7 @@ class InputState:
         self.g_key_pressed = False
         self.c_key_pressed = False
         self.v_key_pressed = False
+        self.m_key_pressed = False
         self.is_brewing = False
         self.brew_timer = 0
         self.esc_pressed = False
@@ -112,9 +149,8 @@ def toggle_fullscreen(fullscreen):
         screen = pygame.display.set_mode((800, 600))
     SCREEN_WIDTH, SCREEN_HEIGHT = screen.get_size()
 
-    # Clear image cache - surfaces need to be reconverted for new display
-    from src.utils.asset_cache import _image_cache
-    _image_cache.clear()
+    # Re-convert cached images for the new display format (no reloading from disk)
+    images_changed = reconvert_images()
 
     # Recreate UI elements with new dimensions
     global loading_screen, main_menu, pause_menu, options_menu, credits_screen, game_over_screen
@@ -147,10 +183,12 @@ def toggle_fullscreen(fullscreen):
         pause_menu.input_cooldown = 30
 
     # Update game objects if they exist (when toggling during gameplay)
-    global background, inventory, lore_display, npc, minimap
+    global background, inventory, lore_display, npc, minimap, world_map, enemy_manager
     if background is not None:
         background.screen_width = SCREEN_WIDTH
         background.screen_height = SCREEN_HEIGHT
+        if images_changed:
+            background.refresh_graphics()
     if inventory is not None:
         inventory.screen_width = SCREEN_WIDTH
         inventory.screen_height = SCREEN_HEIGHT
@@ -162,14 +200,20 @@ def toggle_fullscreen(fullscreen):
         npc.screen_height = SCREEN_HEIGHT
     if minimap is not None:
         minimap.update_position(SCREEN_WIDTH, SCREEN_HEIGHT)
+    if world_map is not None:
+        world_map.update_position(SCREEN_WIDTH, SCREEN_HEIGHT)
+    if enemy_manager is not None:
+        enemy_manager.set_view_size(SCREEN_WIDTH, SCREEN_HEIGHT)
 
 
 def init_new_game(slot, seed=None):
     """Initialize a new game in the given slot."""
     global background, player, inventory, lore_display, cabin, npc, enemy_manager, spawn_point, tutorial, minimap
+    global world_map
     global current_slot, map_seed, play_time, play_time_start
 
-    # Delete existing save if any
+    # Delete existing save if any (after pending saves, which could recreate it)
+    wait_for_saves()
     delete_save(slot)
 
     # Clear caches to force new map generation
@@ -210,7 +254,11 @@ def init_new_game(slot, seed=None):
     npc = Npc(SCREEN_WIDTH, SCREEN_HEIGHT, x=sprytek_pos[0], y=sprytek_pos[1])
 
     # Enemies spawn (not in trees)
-    enemy_manager = EnemyManager(TILE_SIZE, background.map_data, spawn_point, background.tree_positions, num_enemies=50)
+    if enemy_manager is not None:
+        enemy_manager.close()
+    enemy_manager = EnemyManager(TILE_SIZE, background.map_data, spawn_point, background.tree_positions,
+                                 use_worker=settings.get('enemy_ai_worker', False),
+                                 view_size=(SCREEN_WIDTH, SCREEN_HEIGHT))
 
     # Reset input state
     input_state.reset()
@@ -223,15 +271,21 @@ def init_new_game(slot, seed=None):
     else:
         tutorial = None
 
-    # Create minimap
-    minimap = Minimap(SCREEN_WIDTH, SCREEN_HEIGHT, MAP_WIDTH, MAP_HEIGHT, TILE_SIZE)
+    # Create minimap and world map (M key)
+    minimap = Minimap(SCREEN_WIDTH, SCREEN_HEIGHT, MAP_WIDTH, MAP_HEIGHT, TILE_SIZE, background.map_data)
+    world_map = WorldMap(SCREEN_WIDTH, SCREEN_HEIGHT, minimap)
+
+    autosave.start(slot)
+    journal.start(slot)
 
 
 def load_saved_game(slot):
     """Load a game from the given slot."""
     global background, player, inventory, lore_display, cabin, npc, enemy_manager, spawn_point, tutorial, minimap
+    global world_map
     global current_slot, map_seed, play_time, play_time_start
 
+    wait_for_saves()
     save_data = load_game(slot)
     if save_data is None:
         return False
@@ -299,7 +353,11 @@ def load_saved_game(slot):
     npc = Npc(SCREEN_WIDTH, SCREEN_HEIGHT, x=sprytek_pos[0], y=sprytek_pos[1])
 
     # Enemies
-    enemy_manager = EnemyManager(TILE_SIZE, background.map_data, spawn_point, background.tree_positions, num_enemies=50)
+    if enemy_manager is not None:
+        enemy_manager.close()
+    enemy_manager = EnemyManager(TILE_SIZE, background.map_data, spawn_point, background.tree_positions,
+                                 use_worker=settings.get('enemy_ai_worker', False),
+                                 view_size=(SCREEN_WIDTH, SCREEN_HEIGHT))
 
     # Reset input state
     input_state.reset()
@@ -308,19 +366,22 @@ def load_saved_game(slot):
     tutorial = None
 
     # Create minimap and load visited tiles
-    minimap = Minimap(SCREEN_WIDTH, SCREEN_HEIGHT, MAP_WIDTH, MAP_HEIGHT, TILE_SIZE)
+    minimap = Minimap(SCREEN_WIDTH, SCREEN_HEIGHT, MAP_WIDTH, MAP_HEIGHT, TILE_SIZE, background.map_data)
+    visited_mask = save_data.get('visited_mask')
     visited_tiles = save_data.get('visited_tiles', [])
-    if visited_tiles:
+    if visited_mask:
+        minimap.set_visited_mask(visited_mask['bits'])
+    elif visited_tiles:
         minimap.set_visited_tiles(visited_tiles)
+    world_map = WorldMap(SCREEN_WIDTH, SCREEN_HEIGHT, minimap)
 
+    autosave.start(slot)
+    journal.start(slot)
     return True
 
 
-def save_current_game():
-    """Save the current game state."""
-    if current_slot is None or player is None:
-        return False
-
+def gather_game_state(include_mask=True):
+    """Snapshot the current game state (fresh copies, safe to hand to the save worker)."""
     # Calculate total play time
     current_play_time = play_time + (time.time() - play_time_start)
 
@@ -347,10 +408,28 @@ def save_current_game():
             'collected': list(inventory.collected_items),
             'remaining_positions': [(x, y) for x, y, _ in background.collectible_positions],
         },
-        'visited_tiles': minimap.get_visited_tiles() if minimap else [],
+        'visited_mask': {
+            'width': MAP_WIDTH,
+            'height': MAP_HEIGHT,
+            'visited': minimap.visited.copy(),  # Bit-packed by the save worker
+        } if minimap and include_mask else None,
+        'explored_tiles': minimap.explored_count if minimap else 0,
     }
+    return game_state
 
-    return save_game(current_slot, game_state)
+
+def save_current_game(callback=None):
+    """
+    Snapshot the current game state and save it in the background.
+
+    callback(success) runs on the main thread once the save is written.
+    """
+    if current_slot is None or player is None:
+        return False
+
+    save_game_async(current_slot, gather_game_state(), callback)
+    journal.compacted()
+    return True
 
 
 def restart_current_game():
@@ -361,24 +440,30 @@ def restart_current_game():
     music_manager.start()
 
 
-# Preload assets during loading screen
+# Preload assets during loading screen (a batch per frame, decoding in the background)
+asset_preloader = AssetPreloader()
 loading_complete = False
 
 
 def do_loading():
-    """Perform loading tasks."""
+    """Perform a step of the loading tasks."""
     global loading_complete
-    loading_screen.set_progress(10, "Loading assets")
-    preload_all_assets()
-    loading_screen.set_progress(100, "Ready")
-    loading_complete = True
+    loading_complete = asset_preloader.step()
+    if loading_complete:
+        loading_screen.set_progress(100, "Ready")
+    else:
+        loading_screen.set_progress(
+            max(1, int(asset_preloader.progress * 100)),
+            f"Loading assets {asset_preloader.loaded}/{asset_preloader.total}"
+        )
 
 
 # Main game loop
 running = True
-loading_started = False
 
 while running:
+    if alloc_tracker is not None:
+        alloc_tracker.next_frame(current_state)
     events = pygame.event.get()
 
     # Event handling
@@ -386,23 +471,28 @@ while running:
         if event.type == pygame.QUIT:
             running = False
         music_manager.handle_event(event)
+        if alloc_tracker is not None:
+            alloc_tracker.handle_event(event)
 
     music_manager.update()
+    process_save_results()
     keys = pygame.key.get_pressed()
 
     # === LOADING STATE ===
     if current_state == GameState.LOADING:
+        do_loading()
         loading_screen.update()
         loading_screen.draw(screen)
 
-        if not loading_started:
-            loading_started = True
-            do_loading()
-
         if loading_complete:
             current_state = GameState.MAIN_MENU
             main_menu.refresh_saves()
 
+            startup_marks['main_menu'] = time.perf_counter() - startup_start
+            if STARTUP_BENCHMARK:
+                print("STARTUP " + json.dumps(startup_marks))
+                running = False
+
     # === MAIN MENU STATE ===
     elif current_state == GameState.MAIN_MENU:
         action, data = main_menu.update(keys, events)
@@ -453,11 +543,14 @@ while running:
 
     # === PLAYING STATE ===
     elif current_state == GameState.PLAYING:
-        # Handle ESC for pause menu
+        # Handle ESC for pause menu (or closing the world map)
         if keys[pygame.K_ESCAPE] and not input_state.esc_pressed:
-            pause_menu.show()
-            current_state = GameState.PAUSED
-            music_manager.pause()
+            if world_map is not None and world_map.is_showing:
+                world_map.hide()
+            else:
+                pause_menu.show()
+                current_state = GameState.PAUSED
+                music_manager.pause()
             input_state.esc_pressed = True
         elif not keys[pygame.K_ESCAPE]:
             input_state.esc_pressed = False
@@ -474,6 +567,8 @@ while running:
             npc.draw_sprytek(screen, camera_offset)
             background.draw_leaf_particles(screen, camera_offset)
             game_over_screen.draw(screen)
+            if alloc_tracker is not None:
+                alloc_tracker.draw(screen)
             pygame.display.flip()
             clock.tick(60)
             continue
@@ -490,6 +585,28 @@ while running:
             inventory.update_inventory(keys, screen, stored_cats, player.get_fatigue_percent())
             npc.draw_chat_graphics(screen, player, camera_offset)
             lore_display.draw(screen)
+            if alloc_tracker is not None:
+                alloc_tracker.draw(screen)
+
+            pygame.display.flip()
+            clock.tick(60)
+            continue
+
+        # Toggle world map (M) - game is frozen while it is open
+        player_tile_x = player.player_rect.centerx // TILE_SIZE
+        player_tile_y = player.player_rect.centery // TILE_SIZE
+        if keys[pygame.K_m] and not input_state.m_key_pressed and not npc.is_talking:
+            if world_map.is_showing:
+                world_map.hide()
+            else:
+                world_map.show(player_tile_x, player_tile_y)
+        input_state.m_key_pressed = keys[pygame.K_m]
+
+        if world_map.is_showing:
+            world_map.update(keys, events)
+            world_map.draw(screen, player_tile_x, player_tile_y, cabin, background.cat_positions)
+            if alloc_tracker is not None:
+                alloc_tracker.draw(screen)
 
             pygame.display.flip()
             clock.tick(60)
@@ -527,6 +644,7 @@ while running:
                 collected = background.collect_cat(cat_index)
                 if collected:
                     inventory.pick_up_cat(cat_image_index)
+                    journal.record('cat_picked_up', cat=cat_image_index, position=[collected[0], collected[1]])
                     lore_display.show_lore(CATS_LORE[cat_image_index], background.cat_images[cat_image_index])
                     input_state.collect_cooldown = 30
         else:
@@ -539,6 +657,7 @@ while running:
                     collected = background.collect_collectible(coll_index)
                     if collected:
                         inventory.add_collectible(coll_item_index)
+                        journal.record('item_collected', item=coll_item_index, position=[collected[0], collected[1]])
                         lore_display.show_lore(COLLECTIBLES_LORE[coll_item_index], background.collectible_images[coll_item_index])
                         input_state.collect_cooldown = 30
             else:
@@ -555,6 +674,7 @@ while running:
                     cat_idx = inventory.put_down_cat()
                     if cat_idx is not None:
                         cabin.store_cat(cat_idx)
+                        journal.record('cat_stored', cat=cat_idx)
                     input_state.collect_cooldown = 30
         else:
             inventory.set_storage_hint(False)
@@ -583,6 +703,7 @@ while running:
             if input_state.brew_timer <= 0:
                 input_state.is_brewing = False
                 inventory.fill_thermos()
+                journal.record('coffee_brewed')
 
         # Drink coffee
         if inventory.has_coffee_available() and not input_state.is_brewing:
@@ -591,6 +712,7 @@ while running:
             if keys[pygame.K_v] and not input_state.v_key_pressed and input_state.collect_cooldown == 0:
                 if inventory.drink_coffee():
                     player.drink_coffee()
+                    journal.record('coffee_drunk')
                     input_state.collect_cooldown = 30
 
         input_state.c_key_pressed = keys[pygame.K_c]
@@ -623,7 +745,13 @@ while running:
         if minimap:
             player_tile_x = player.player_rect.centerx // TILE_SIZE
             player_tile_y = player.player_rect.centery // TILE_SIZE
-            minimap.update(player_tile_x, player_tile_y)
+            dirty = minimap.update(player_tile_x, player_tile_y)
+            world_map.mark_revealed(dirty)
+            autosave.mark_revealed(dirty)
+            journal.record_tiles(dirty, minimap.visited)
+            if autosave.update(gather_game_state, minimap.visited):
+                journal.compacted()
+            journal.flush(gather_game_state)
             minimap.draw(screen, background.map_data, player_tile_x, player_tile_y, cabin, background.cat_positions)
 
         # Update and draw tutorial if active
@@ -646,8 +774,8 @@ while running:
             music_manager.resume()
 
         elif action == "save":
-            success = save_current_game()
-            pause_menu.show_save_message(success)
+            if not save_current_game(lambda success: pause_menu.show_save_message(success)):
+                pause_menu.show_save_message(False)
 
         elif action == "options":
             previous_state = GameState.PAUSED
@@ -655,11 +783,13 @@ while running:
             current_state = GameState.OPTIONS
 
         elif action == "main_menu":
-            save_current_game()  # Auto-save before leaving
+            save_current_game(lambda success: main_menu.refresh_saves())  # Auto-save before leaving
+            autosave.stop()
+            journal.stop()
             music_manager.stop()
             current_state = GameState.MAIN_MENU
             main_menu.state = MainMenu.STATE_MAIN
-            main_menu.refresh_saves()
+            # The slots are refreshed by the save's callback (not now, while it is written)
 
         elif action == "quit":
             save_current_game()  # Auto-save before quitting
@@ -719,7 +849,22 @@ while running:
         credits_screen.draw(screen)
 
     # Update display
+    if alloc_tracker is not None:
+        alloc_tracker.draw(screen)
     pygame.display.flip()
     clock.tick(60)
 
+# Font sizes actually used this session (python main.py --font-report)
+if '--font-report' in sys.argv:
+    print("Font sizes used (size, first use [s], lookups):")
+    for size, first_use, lookups in get_font_report():
+        print(f"  {size:>3}px  {first_use:7.3f}s  {lookups}")
+
+if alloc_tracker is not None:
+    alloc_tracker.disable()
+
+# Let background saves (e.g. the auto-save on quit) finish writing
+wait_for_saves()
+if enemy_manager is not None:
+    enemy_manager.close()
 pygame.quit()
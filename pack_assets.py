@@ -0,0 +1,7 @@
+"""Pack the game assets into a single archive for Mind of Seasons (see src/utils/asset_archive.py)."""
+
+from src.utils.asset_archive import ARCHIVE_NAME, build_archive
+
+if __name__ == "__main__":
+    packed = build_archive()
+    print(f"Packed {packed} files into {ARCHIVE_NAME} (delete it to use loose files again)")
@@ -6,7 +6,7 @@ import time
 
 import pygame
 
-from src.utils import resource_path
+from src.utils import open_asset, list_assets
 
 MUSIC_END_EVENT = pygame.USEREVENT + 10
 
@@ -15,7 +15,8 @@ class MusicManager:
     """Handles background music playback with random gaps between tracks."""
 
     def __init__(self, music_dir: str = "audio/music"):
-        self._dir = resource_path(music_dir)
+        self._dir = music_dir
+        self._track_file = None  # Open file of the current track (music streams from it)
         self._tracks: list[str] = []
         self._last_track: str | None = None
         self._playing = False
@@ -32,13 +33,10 @@ class MusicManager:
     # ------------------------------------------------------------------
 
     def _scan_tracks(self):
-        if not os.path.isdir(self._dir):
-            return
-        self._tracks = sorted(
-            os.path.join(self._dir, f)
-            for f in os.listdir(self._dir)
-            if f.endswith((".ogg", ".wav", ".mp3"))
-        )
+        self._tracks = [
+            track for track in list_assets(self._dir)
+            if track.endswith((".ogg", ".wav", ".mp3"))
+        ]
 
     def _pick_track(self) -> str | None:
         if not self._tracks:
@@ -108,7 +106,11 @@ class MusicManager:
             return
         self._last_track = track
         try:
-            pygame.mixer.music.load(track)
+            track_file = open_asset(track)
+            pygame.mixer.music.load(track_file, os.path.basename(track))
+            if self._track_file is not None:
+                self._track_file.close()
+            self._track_file = track_file
             pygame.mixer.music.set_volume(self._effective_volume())
             pygame.mixer.music.play()
         except Exception as e:
@@ -1,26 +1,134 @@
 import pygame
 import random
-from src.utils import get_image, get_cached_enemy_spawns, set_cached_enemy_spawns
+import math
+from src.utils import get_animation, get_animation_frame, get_cached_enemy_spawns, set_cached_enemy_spawns
 
 ENEMY_SIZE = (80, 80)
 
+# Line of sight
+LOS_CACHE_LIMIT = 4096  # cached (enemy tile, player tile) raycasts
+
+# Population streaming
+REGION_SIZE = 32  # tiles per population region side
+ENEMY_DENSITY = 50 / (600 * 600)  # enemies per map tile (50 on a 600x600 map)
+
 
 def load_graphics():
-    """Load enemy graphics with animation frames (uses cache)."""
-    frames = []
-    for i in range(1, 5):
-        img = get_image(f'graphics/npc/enemy/enemy{i}.png', ENEMY_SIZE)
-        frames.append(img)
-    return frames
+    """Load enemy animation frames and their mirrored variants (uses cache)."""
+    paths = [f'graphics/npc/enemy/enemy{i}.png' for i in range(1, 5)]
+    return get_animation('enemy', paths, ENEMY_SIZE)
+
+
+def poisson_disk_sample(candidates, min_spacing, max_count):
+    """
+    Pick up to max_count positions that are at least min_spacing tiles apart.
+
+    Candidates are accepted in the given order (shuffle them first for random
+    results). A background grid with cells of min_spacing / sqrt(2) holds at
+    most one accepted point per cell, so each candidate is checked against a
+    fixed 5x5 neighbourhood instead of every accepted point.
+
+    Args:
+        candidates: Iterable of (x, y) tile positions
+        min_spacing: Minimum Euclidean distance between picked positions
+        max_count: Maximum number of positions to pick
+
+    Returns:
+        List of (x, y) tuples
+    """
+    selected = []
+    if max_count <= 0:
+        return selected
+
+    cell_size = min_spacing / math.sqrt(2)
+    min_spacing_sq = min_spacing * min_spacing
+    grid = {}
+
+    for x, y in candidates:
+        cell_x = int(x // cell_size)
+        cell_y = int(y // cell_size)
+
+        too_close = False
+        for gy in range(cell_y - 2, cell_y + 3):
+            for gx in range(cell_x - 2, cell_x + 3):
+                other = grid.get((gx, gy))
+                if other is not None:
+                    dx = x - other[0]
+                    dy = y - other[1]
+                    if dx * dx + dy * dy < min_spacing_sq:
+                        too_close = True
+                        break
+            if too_close:
+                break
+
+        if not too_close:
+            grid[(cell_x, cell_y)] = (x, y)
+            selected.append((x, y))
+            if len(selected) >= max_count:
+                break
+
+    return selected
+
+
+def bresenham_line(x0, y0, x1, y1):
+    """Yield tiles on the line from (x0, y0) to (x1, y1), both ends included."""
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    step_x = 1 if x0 < x1 else -1
+    step_y = 1 if y0 < y1 else -1
+    err = dx + dy
+
+    while True:
+        yield x0, y0
+        if x0 == x1 and y0 == y1:
+            return
+        err2 = 2 * err
+        if err2 >= dy:
+            err += dy
+            x0 += step_x
+        if err2 <= dx:
+            err += dx
+            y0 += step_y
+
+
+class WalkGrid:
+    """Row-major walkability grid (1 = walkable, 0 = tree) shared by all enemies."""
+
+    def __init__(self, width, height, cells):
+        self.width = width
+        self.height = height
+        # Any buffer indexable by int: bytearray, or a shared memory view
+        self.cells = cells
+
+    @classmethod
+    def from_map(cls, map_data, tree_tiles):
+        """Build a walkability grid from map data and tree tiles."""
+        height = len(map_data)
+        width = len(map_data[0]) if map_data else 0
+        cells = bytearray(b'\x01') * (width * height)
+        for tx, ty in tree_tiles:
+            if 0 <= tx < width and 0 <= ty < height:
+                cells[ty * width + tx] = 0
+        return cls(width, height, cells)
+
+    def is_walkable(self, tile_x, tile_y):
+        """Check if a tile is inside the map and not a tree."""
+        if 0 <= tile_x < self.width and 0 <= tile_y < self.height:
+            return self.cells[tile_y * self.width + tile_x] == 1
+        return False
 
 
 class Enemy:
-    def __init__(self, x, y, tile_size, map_data, tree_tiles=None):
-        self.animation_frames = load_graphics()
+    def __init__(self, x, y, tile_size, walk_grid, load_frames=True):
+        if load_frames:
+            frames, _ = load_graphics()
+            self.frame_count = len(frames)
+        else:
+            # AI-only enemy (worker process), never drawn
+            self.frame_count = 0
         self.tile_size = tile_size
-        self.map_data = map_data
-        # tree_tiles is now passed as a shared set from EnemyManager
-        self.tree_tiles = tree_tiles or set()
+        # walk_grid is shared by all enemies from EnemyManager
+        self.walk_grid = walk_grid
 
         # Animation state
         self.current_frame = 0
@@ -52,13 +160,7 @@ class Enemy:
 
     def _is_walkable(self, tile_x, tile_y):
         """Check if a tile is walkable (path or grass, but not tree)."""
-        if 0 <= tile_y < len(self.map_data) and 0 <= tile_x < len(self.map_data[0]):
-            # Nie może wchodzić w drzewa
-            if (tile_x, tile_y) in self.tree_tiles:
-                return False
-            # Może chodzić po trawie i ścieżce
-            return True
-        return False
+        return self.walk_grid.is_walkable(tile_x, tile_y)
 
     def _get_current_tile(self):
         """Get current tile position."""
@@ -129,21 +231,32 @@ class Enemy:
 
         return move_x, move_y
 
-    def update(self, dt=16, player_rect=None):
+    def update(self, dt=16, player_rect=None, can_see_player=True):
         """Update enemy position, AI and animation."""
-        self.change_direction_timer += 1
+        self.update_animation(dt)
+        self.update_ai(player_rect, can_see_player)
 
-        # Update animation
+    def update_animation(self, dt=16):
+        """Advance the animation frame."""
         self.animation_timer += dt
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
-            self.current_frame = (self.current_frame + 1) % len(self.animation_frames)
+            self.current_frame = (self.current_frame + 1) % self.frame_count
+
+    def update_ai(self, player_rect=None, can_see_player=True):
+        """
+        Update enemy position and chase state.
+
+        can_see_player gates chase acquisition (line of sight), losing the
+        player still only depends on distance.
+        """
+        self.change_direction_timer += 1
 
         # Check if should chase player
         if player_rect:
             distance = self._get_distance_to(player_rect)
 
-            if distance < self.chase_distance:
+            if distance < self.chase_distance and can_see_player:
                 self.is_chasing = True
             elif distance > self.lose_distance:
                 self.is_chasing = False
@@ -201,6 +314,15 @@ class Enemy:
                 self.x = self.rect.x - self.hitbox_offset[0]
                 self.y = self.rect.y - self.hitbox_offset[1]
 
+    def apply_state(self, rect_x, rect_y, direction, is_chasing):
+        """Set position and AI state computed elsewhere (enemy AI worker)."""
+        self.rect.x = rect_x
+        self.rect.y = rect_y
+        self.x = self.rect.x - self.hitbox_offset[0]
+        self.y = self.rect.y - self.hitbox_offset[1]
+        self.direction = direction
+        self.is_chasing = is_chasing
+
     def check_collision(self, player_rect):
         """Check collision with player."""
         return self.rect.colliderect(player_rect)
@@ -211,28 +333,64 @@ class Enemy:
         screen_pos = (self.x - camera_offset[0],
                       self.y - camera_offset[1])
 
-        # Get current animation frame
-        img = self.animation_frames[self.current_frame]
-
-        # Flip sprite based on direction
-        if self.direction == 'left':
-            img = pygame.transform.flip(img, True, False)
-
+        # Current animation frame (pre-flipped when facing left)
+        img = get_animation_frame('enemy', self.current_frame, self.direction == 'left')
         screen.blit(img, screen_pos)
 
+    def get_sprite_key(self):
+        """Atlas key of the current frame: ('enemy', frame, flipped)."""
+        return ('enemy', self.current_frame, self.direction == 'left')
+
 
 class EnemyManager:
-    """Manages all enemies in the game."""
+    """
+    Manages all enemies in the game.
 
-    def __init__(self, tile_size, map_data, spawn_point, tree_positions=None, num_enemies=10):
+    Only enemies around the camera view are kept alive. The rest of the
+    population is stored per region as compact (tile_x, tile_y) records, which
+    are spawned just outside the view as the player approaches and written
+    back when the enemy is left far behind.
+
+    The population is placed once, at ENEMY_DENSITY, and then conserved:
+    records only move between live and dormant, so each region keeps the
+    enemies that were placed in it or wandered into it.
+    """
+
+    def __init__(self, tile_size, map_data, spawn_point, tree_positions=None, num_enemies=None, max_active=40,
+                 use_worker=False, view_size=(800, 600)):
         self.tile_size = tile_size
         self.map_data = map_data
         self.tree_positions = tree_positions or []
         self.tree_tiles = set((tx, ty) for tx, ty, _ in self.tree_positions)
-        self.enemies = []
+        self.walk_grid = WalkGrid.from_map(map_data, self.tree_tiles)
+        self.enemies = []  # Live enemies only
+
+        # Population scales with map size unless given explicitly
+        map_width = len(map_data[0]) if map_data else 0
+        map_height = len(map_data)
+        self.map_width = map_width
+        self.map_height = map_height
+        if num_enemies is None:
+            num_enemies = max(1, int(map_width * map_height * ENEMY_DENSITY))
+
+        # Streaming settings (Chebyshev distance in tiles from the camera view)
+        self.view_width, self.view_height = view_size  # pixels
+        self.spawn_radius = 8
+        self.despawn_radius = 16
+        self.max_active = max_active
+        self.stream_interval = 30  # frames between streaming passes
+        self._stream_timer = 0
+        self._last_player_region = None
+
+        # Dormant population: region -> list of (tile_x, tile_y)
+        self.dormant = {}
+
+        # Line of sight: (enemy tile, player tile) -> bool
+        self._los_cache = {}
+        self._detection_radius = 150  # pixels, matches Enemy.chase_distance
 
         # Try to use cached spawn positions (huge performance gain on respawn)
-        cache_key = (len(map_data), len(map_data[0]) if map_data else 0, spawn_point, num_enemies)
+        cache_key = (map_height, map_width, spawn_point, num_enemies)
         cached_positions = get_cached_enemy_spawns(cache_key)
 
         if cached_positions:
@@ -241,10 +399,98 @@ class EnemyManager:
             spawn_positions = self._find_spawn_positions(spawn_point, num_enemies)
             set_cached_enemy_spawns(cache_key, spawn_positions)
 
-        # Create enemies with shared tree_tiles set (huge performance gain)
         for pos in spawn_positions:
-            enemy = Enemy(pos[0], pos[1], tile_size, map_data, self.tree_tiles)
-            self.enemies.append(enemy)
+            self._store_record(pos)
+
+        # Optional AI worker process (falls back to in-process AI)
+        self._worker = None
+        if use_worker:
+            from src.entities import enemy_worker
+            if enemy_worker.is_supported():
+                try:
+                    self._worker = enemy_worker.EnemyAIWorker(self.walk_grid, tile_size, max_active)
+                except Exception as e:
+                    print(f"Warning: Could not start enemy AI worker: {e}")
+            else:
+                print("Warning: Enemy AI worker is not supported on this platform")
+
+    def _store_record(self, tile_pos):
+        """Store a dormant enemy record in its region."""
+        region = (tile_pos[0] // REGION_SIZE, tile_pos[1] // REGION_SIZE)
+        self.dormant.setdefault(region, []).append(tile_pos)
+
+    def set_view_size(self, width, height):
+        """Set the screen size in pixels (e.g. after toggling fullscreen)."""
+        self.view_width = width
+        self.view_height = height
+        self._last_player_region = None  # Stream again on the next update
+
+    def _get_view_tiles(self, player_rect):
+        """
+        Get the tiles (x0, y0, x1, y1), inclusive, where an enemy would be on screen.
+
+        Uses the same clamped camera as calculate_camera_offset, so the view
+        is off-centre near the map edges.
+        """
+        offset_x = player_rect.x - self.view_width // 2
+        offset_y = player_rect.y - self.view_height // 2
+        offset_x = max(0, min(offset_x, self.map_width * self.tile_size - self.view_width))
+        offset_y = max(0, min(offset_y, self.map_height * self.tile_size - self.view_height))
+
+        # Sprites are drawn from the tile's corner and are larger than a tile
+        return ((offset_x - ENEMY_SIZE[0]) // self.tile_size + 1,
+                (offset_y - ENEMY_SIZE[1]) // self.tile_size + 1,
+                (offset_x + self.view_width - 1) // self.tile_size,
+                (offset_y + self.view_height - 1) // self.tile_size)
+
+    def get_population_count(self):
+        """Get total number of enemies (live and dormant)."""
+        return len(self.enemies) + sum(len(records) for records in self.dormant.values())
+
+    def _stream(self, player_rect):
+        """Despawn enemies far from the view and spawn dormant ones just outside it."""
+        x0, y0, x1, y1 = self._get_view_tiles(player_rect)
+
+        # Despawn enemies left far behind into compact records
+        kept = []
+        for enemy in self.enemies:
+            tx, ty = enemy._get_current_tile()
+            if not enemy.is_chasing and max(x0 - tx, tx - x1, y0 - ty, ty - y1) > self.despawn_radius:
+                self._store_record((tx, ty))
+                if self._worker is not None:
+                    self._worker.remove_enemy(enemy)
+            else:
+                kept.append(enemy)
+        self.enemies = kept
+
+        # Spawn dormant enemies inside the spawn ring but outside the view
+        min_rx = (x0 - self.spawn_radius) // REGION_SIZE
+        max_rx = (x1 + self.spawn_radius) // REGION_SIZE
+        min_ry = (y0 - self.spawn_radius) // REGION_SIZE
+        max_ry = (y1 + self.spawn_radius) // REGION_SIZE
+
+        for ry in range(min_ry, max_ry + 1):
+            for rx in range(min_rx, max_rx + 1):
+                records = self.dormant.get((rx, ry))
+                if not records:
+                    continue
+
+                remaining = []
+                for tx, ty in records:
+                    # 0 < dist: never spawn where the enemy would be on screen
+                    dist = max(x0 - tx, tx - x1, y0 - ty, ty - y1)
+                    if 0 < dist <= self.spawn_radius and len(self.enemies) < self.max_active:
+                        enemy = Enemy(tx, ty, self.tile_size, self.walk_grid)
+                        self.enemies.append(enemy)
+                        if self._worker is not None:
+                            self._worker.add_enemy(enemy, tx, ty)
+                    else:
+                        remaining.append((tx, ty))
+
+                if remaining:
+                    self.dormant[(rx, ry)] = remaining
+                else:
+                    del self.dormant[(rx, ry)]
 
     def _is_near_tree(self, x, y, radius=2):
         """Check if position is near any tree (trees are larger than 1 tile)."""
@@ -256,46 +502,119 @@ class EnemyManager:
 
     def _find_spawn_positions(self, spawn_point, num_enemies):
         """Find valid spawn positions on paths only, away from player spawn."""
-        valid_positions = []
         min_distance_from_spawn = 25  # tiles - safe zone around cabin
-
-        for y in range(len(self.map_data)):
-            for x in range(len(self.map_data[y])):
-                # Spawn only on paths (not grass between trees)
-                if self.map_data[y][x] != 'path':
-                    continue
-
-                # Check distance from spawn
-                dist = ((x - spawn_point[0]) ** 2 + (y - spawn_point[1]) ** 2) ** 0.5
-                if dist > min_distance_from_spawn:
-                    valid_positions.append((x, y))
-
-        # Select random positions, ensuring some spacing
-        selected = []
         min_enemy_spacing = 8  # tiles between enemies
 
+        # Spawn only on paths (not grass between trees), outside the safe zone
+        sx, sy = spawn_point
+        min_dist_sq = min_distance_from_spawn * min_distance_from_spawn
+        valid_positions = []
+        for y, row in enumerate(self.map_data):
+            dy_sq = (y - sy) * (y - sy)
+            valid_positions.extend(
+                (x, y) for x, tile in enumerate(row)
+                if tile == 'path' and (x - sx) * (x - sx) + dy_sq > min_dist_sq
+            )
+
         random.shuffle(valid_positions)
-        for pos in valid_positions:
-            if len(selected) >= num_enemies:
+        return poisson_disk_sample(valid_positions, min_enemy_spacing, num_enemies)
+
+    def _has_line_of_sight(self, enemy_tile, player_tile):
+        """Raycast between tiles, blocked by trees and unwalkable tiles (cached)."""
+        key = (enemy_tile, player_tile)
+        cached = self._los_cache.get(key)
+        if cached is not None:
+            return cached
+
+        visible = True
+        for tx, ty in bresenham_line(enemy_tile[0], enemy_tile[1], player_tile[0], player_tile[1]):
+            if (tx, ty) == enemy_tile or (tx, ty) == player_tile:
+                continue
+            if not self.walk_grid.is_walkable(tx, ty):
+                visible = False
                 break
 
-            # Check spacing from other enemies
-            too_close = False
-            for other in selected:
-                dist = ((pos[0] - other[0]) ** 2 + (pos[1] - other[1]) ** 2) ** 0.5
-                if dist < min_enemy_spacing:
-                    too_close = True
-                    break
+        # Simple bound on memory: drop everything once the limit is reached
+        if len(self._los_cache) >= LOS_CACHE_LIMIT:
+            self._los_cache.clear()
+        self._los_cache[key] = visible
+        return visible
+
+    def _query_enemies_near(self, x, y, radius):
+        """Get live enemies within radius pixels of (x, y)."""
+        # Streaming keeps at most max_active enemies live, so a squared
+        # distance check over all of them is cheaper than any index
+        radius_sq = radius * radius
+        found = []
+        for enemy in self.enemies:
+            dx = enemy.rect.centerx - x
+            dy = enemy.rect.centery - y
+            if dx * dx + dy * dy < radius_sq:
+                found.append(enemy)
+        return found
+
+    def _get_enemies_seeing_player(self, player_rect):
+        """Get non-chasing enemies in detection radius that have line of sight."""
+        player_tile = (player_rect.centerx // self.tile_size, player_rect.centery // self.tile_size)
+        seeing = set()
+        for enemy in self._query_enemies_near(player_rect.centerx, player_rect.centery, self._detection_radius):
+            if enemy.is_chasing:
+                continue
+            if self._has_line_of_sight(enemy._get_current_tile(), player_tile):
+                seeing.add(enemy)
+        return seeing
+
+    def update(self, dt=16, player_rect=None):
+        """Stream the population around the player and update live enemies."""
+        if self._worker is not None:
+            self._update_with_worker(dt, player_rect)
+            return
+
+        if player_rect is not None:
+            player_tile = (player_rect.centerx // self.tile_size, player_rect.centery // self.tile_size)
+            player_region = (player_tile[0] // REGION_SIZE, player_tile[1] // REGION_SIZE)
+
+            self._stream_timer += 1
+            if player_region != self._last_player_region or self._stream_timer >= self.stream_interval:
+                self._stream_timer = 0
+                self._last_player_region = player_region
+                self._stream(player_rect)
+
+            # Raycasts only for enemies inside the detection radius
+            seeing = self._get_enemies_seeing_player(player_rect)
+            for enemy in self.enemies:
+                enemy.update(dt, player_rect, enemy in seeing)
+        else:
+            for enemy in self.enemies:
+                enemy.update(dt, player_rect)
 
-            if not too_close:
-                selected.append(pos)
+    def _update_with_worker(self, dt, player_rect):
+        """Read the worker's latest snapshot, then queue the next AI tick."""
+        self._worker.apply_snapshot()
 
-        return selected
+        seeing = set()
+        if player_rect is not None:
+            player_tile = (player_rect.centerx // self.tile_size, player_rect.centery // self.tile_size)
+            player_region = (player_tile[0] // REGION_SIZE, player_tile[1] // REGION_SIZE)
+
+            self._stream_timer += 1
+            if player_region != self._last_player_region or self._stream_timer >= self.stream_interval:
+                self._stream_timer = 0
+                self._last_player_region = player_region
+                self._stream(player_rect)
+
+            seeing = self._get_enemies_seeing_player(player_rect)
 
-    def update(self, dt=16, player_rect=None):
-        """Update all enemies."""
         for enemy in self.enemies:
-            enemy.update(dt, player_rect)
+            enemy.update_animation(dt)
+
+        self._worker.request_tick(player_rect, seeing)
+
+    def close(self):
+        """Stop the AI worker process if one is running."""
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
 
     def check_player_collision(self, player_rect):
         """Check if player collides with any enemy."""
@@ -304,7 +623,18 @@ class EnemyManager:
                 return True
         return False
 
-    def draw(self, screen, camera_offset):
-        """Draw all enemies."""
+    def draw(self, screen, camera_offset, atlas=None):
+        """Draw all enemies, in one blits call from the sprite atlas if given."""
+        if atlas is None:
+            for enemy in self.enemies:
+                enemy.draw(screen, camera_offset)
+            return
+
+        blit_list = []
         for enemy in self.enemies:
-            enemy.draw(screen, camera_offset)
+            sprite = atlas.get(enemy.get_sprite_key())
+            if sprite is None:
+                enemy.draw(screen, camera_offset)
+                continue
+            blit_list.append((sprite.sheet, (enemy.x - camera_offset[0], enemy.y - camera_offset[1]), sprite.area))
+        screen.blits(blit_list, doreturn=False)
@@ -0,0 +1,192 @@
+"""
+Optional enemy AI worker process.
+
+The walkability grid and a double-buffered enemy state table live in
+multiprocessing.shared_memory. The worker advances the AI one tick ahead
+while the main process renders and reads the latest completed snapshot.
+
+Protocol: the main process sends at most one tick at a time and only sends
+the next one after the previous snapshot has been published, so the worker
+never writes into the buffer the main process is reading.
+"""
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+
+import pygame
+
+DIRECTIONS = ['up', 'down', 'left', 'right']
+
+# Snapshot fields per enemy slot (float64)
+FIELD_GEN = 0  # Slot generation, 0 = empty
+FIELD_X = 1  # Hitbox rect x
+FIELD_Y = 2  # Hitbox rect y
+FIELD_DIRECTION = 3  # Index into DIRECTIONS
+FIELD_CHASING = 4
+NUM_FIELDS = 5
+
+# Header (int64): front buffer index, last completed tick
+HEADER_FRONT = 0
+HEADER_SEQ = 1
+HEADER_SIZE = 2 * 8
+
+
+def is_supported():
+    """Worker mode needs fork: main.py runs the game at import time."""
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _worker_main(grid_name, state_name, width, height, tile_size, capacity, commands):
+    """Worker process loop: apply spawns/despawns, advance AI, publish snapshot."""
+    from src.entities.enemy import Enemy, WalkGrid
+
+    grid_shm = shared_memory.SharedMemory(name=grid_name)
+    state_shm = shared_memory.SharedMemory(name=state_name)
+    walk_grid = WalkGrid(width, height, grid_shm.buf)
+    header = state_shm.buf[:HEADER_SIZE].cast('q')
+    data = state_shm.buf[HEADER_SIZE:].cast('d')
+
+    slots = [None] * capacity
+    generations = [0] * capacity
+
+    try:
+        while True:
+            message = commands.get()
+            if message is None:
+                break
+            seq, player_rect, seeing_slots, spawns, despawns = message
+
+            for slot in despawns:
+                slots[slot] = None
+            for slot, gen, tile_x, tile_y in spawns:
+                slots[slot] = Enemy(tile_x, tile_y, tile_size, walk_grid, load_frames=False)
+                generations[slot] = gen
+
+            player = pygame.Rect(player_rect) if player_rect is not None else None
+            back = 1 - header[HEADER_FRONT]
+            base = back * capacity * NUM_FIELDS
+
+            for slot, enemy in enumerate(slots):
+                offset = base + slot * NUM_FIELDS
+                if enemy is None:
+                    data[offset + FIELD_GEN] = 0
+                    continue
+                enemy.update_ai(player, slot in seeing_slots)
+                data[offset + FIELD_GEN] = generations[slot]
+                data[offset + FIELD_X] = enemy.rect.x
+                data[offset + FIELD_Y] = enemy.rect.y
+                data[offset + FIELD_DIRECTION] = DIRECTIONS.index(enemy.direction)
+                data[offset + FIELD_CHASING] = 1 if enemy.is_chasing else 0
+
+            # Publish
+            header[HEADER_FRONT] = back
+            header[HEADER_SEQ] = seq
+    finally:
+        walk_grid.cells = None
+        del header, data
+        grid_shm.close()
+        state_shm.close()
+
+
+class EnemyAIWorker:
+    """Runs enemy AI for a fixed number of slots in a separate process."""
+
+    def __init__(self, walk_grid, tile_size, capacity):
+        self.capacity = capacity
+
+        # Walkability grid in shared memory
+        self._grid_shm = shared_memory.SharedMemory(create=True, size=max(1, len(walk_grid.cells)))
+        self._grid_shm.buf[:len(walk_grid.cells)] = bytes(walk_grid.cells)
+
+        # Header + two snapshot buffers
+        state_size = HEADER_SIZE + 2 * capacity * NUM_FIELDS * 8
+        self._state_shm = shared_memory.SharedMemory(create=True, size=state_size)
+        self._state_shm.buf[:state_size] = bytes(state_size)
+        self._header = self._state_shm.buf[:HEADER_SIZE].cast('q')
+        self._data = self._state_shm.buf[HEADER_SIZE:].cast('d')
+
+        # Slot bookkeeping (main process side)
+        self._free_slots = list(range(capacity - 1, -1, -1))
+        self._slots = {}  # enemy -> (slot, generation)
+        self._next_gen = 1
+        self._pending_spawns = []
+        self._pending_despawns = []
+        self._sent_seq = 0
+
+        context = multiprocessing.get_context('fork')
+        self._commands = context.Queue()
+        self._process = context.Process(
+            target=_worker_main,
+            args=(self._grid_shm.name, self._state_shm.name, walk_grid.width, walk_grid.height,
+                  tile_size, capacity, self._commands),
+            daemon=True,
+        )
+        self._process.start()
+
+    def add_enemy(self, enemy, tile_x, tile_y):
+        """Register a newly spawned enemy (sent with the next tick)."""
+        slot = self._free_slots.pop()
+        gen = self._next_gen
+        self._next_gen += 1
+        self._slots[enemy] = (slot, gen)
+        self._pending_spawns.append((slot, gen, tile_x, tile_y))
+
+    def remove_enemy(self, enemy):
+        """Unregister a despawned enemy (sent with the next tick)."""
+        slot, gen = self._slots.pop(enemy)
+        self._free_slots.append(slot)
+        if (slot, gen) in [(s, g) for s, g, _, _ in self._pending_spawns]:
+            # Worker never saw this enemy, just drop the spawn
+            self._pending_spawns = [spawn for spawn in self._pending_spawns if spawn[:2] != (slot, gen)]
+        else:
+            self._pending_despawns.append(slot)
+
+    def apply_snapshot(self):
+        """Copy the latest completed snapshot into the live Enemy objects."""
+        front = self._header[HEADER_FRONT]
+        base = front * self.capacity * NUM_FIELDS
+        data = self._data
+        for enemy, (slot, gen) in self._slots.items():
+            offset = base + slot * NUM_FIELDS
+            # Skip slots the worker hasn't picked up yet (or reused ones)
+            if int(data[offset + FIELD_GEN]) != gen:
+                continue
+            enemy.apply_state(
+                int(data[offset + FIELD_X]),
+                int(data[offset + FIELD_Y]),
+                DIRECTIONS[int(data[offset + FIELD_DIRECTION])],
+                data[offset + FIELD_CHASING] != 0,
+            )
+
+    def request_tick(self, player_rect, seeing):
+        """Ask the worker for the next tick unless the previous one is still running."""
+        if self._header[HEADER_SEQ] != self._sent_seq:
+            return False
+
+        self._sent_seq += 1
+        seeing_slots = {self._slots[enemy][0] for enemy in seeing if enemy in self._slots}
+        player = tuple(player_rect) if player_rect is not None else None
+        self._commands.put((self._sent_seq, player, seeing_slots,
+                            self._pending_spawns, self._pending_despawns))
+        self._pending_spawns = []
+        self._pending_despawns = []
+        return True
+
+    def close(self):
+        """Stop the worker and free shared memory."""
+        if self._process is None:
+            return
+        try:
+            self._commands.put(None)
+            self._process.join(timeout=1.0)
+        except (OSError, ValueError, queue.Full):
+            pass
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process = None
+
+        del self._header, self._data
+        self._grid_shm.close()
+        self._grid_shm.unlink()
+        self._state_shm.close()
+        self._state_shm.unlink()
@@ -2,7 +2,7 @@
 # TODO Collision with Sprytek is not precise, can be improved later
 import json
 import pygame
-from src.utils import get_image, get_font, resource_path
+from src.utils import get_image, get_font, get_bytes, LazyList
 
 
 # Load Sprytek graphics (uses cache)
@@ -12,13 +12,12 @@ def load_sprytek():
 
 def _load_dialogs():
     """Load Sprytek dialogs from JSON file."""
-    with open(resource_path('data/dialogs.json'), 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = json.loads(get_bytes('data/dialogs.json').decode('utf-8'))
     return data.get('sprytek', [])
 
 
-# Load dialogs from JSON
-SPRYTEK_DIALOGS = _load_dialogs()
+# Dialogs from JSON, loaded on first use
+SPRYTEK_DIALOGS = LazyList(_load_dialogs)
 
 class Npc:
     def __init__(self, screen_width, screen_height, x, y):
@@ -1,22 +1,25 @@
 import pygame
-from src.utils import get_image
+from src.utils import get_animation, get_animation_frame
 
 PLAYER_SIZE = (70, 70)
 
 
 def load_graphics():
-    """Load and scale player graphics (uses cache)."""
-    idle = get_image('graphics/character/character_idle.png', PLAYER_SIZE)
-    walk1 = get_image('graphics/character/character_walk1.png', PLAYER_SIZE)
-    walk2 = get_image('graphics/character/character_walk2.png', PLAYER_SIZE)
+    """Load and scale player graphics with mirrored variants (uses cache)."""
+    idle = get_animation('player_idle', ['graphics/character/character_idle.png'], PLAYER_SIZE)
+    walk = get_animation('player_walk', [
+        'graphics/character/character_walk1.png',
+        'graphics/character/character_walk2.png',
+    ], PLAYER_SIZE)
 
-    return idle, [walk1, walk2]
+    return idle, walk
 
 
 class Player:
     def __init__(self, screen_width, screen_height, tile_size, spawn_position=None):
-        self.idle_image, self.walk_animation = load_graphics()
-        self.image = self.idle_image
+        (idle_frames, _), (walk_frames, _) = load_graphics()
+        self.walk_frame_count = len(walk_frames)
+        self.image = idle_frames[0]
         self.tile_size = tile_size
 
         # Animation state
@@ -39,10 +42,10 @@ class Player:
             spawn_x = spawn_position[0] * tile_size
             spawn_y = spawn_position[1] * tile_size
             self.map_position = list(spawn_position)
-            self.player_rect = self.idle_image.get_rect(topleft=(spawn_x, spawn_y))
+            self.player_rect = self.image.get_rect(topleft=(spawn_x, spawn_y))
         else:
             self.map_position = [10, 10]
-            self.player_rect = self.idle_image.get_rect(center=(screen_width // 2, screen_height // 2))
+            self.player_rect = self.image.get_rect(center=(screen_width // 2, screen_height // 2))
 
     def update(self, keys, clock, npc, background=None, cabin=None):
         """Update player position and animation."""
@@ -90,19 +93,15 @@ class Player:
         self.map_position[0] = self.player_rect.x // self.tile_size
         self.map_position[1] = self.player_rect.y // self.tile_size
 
-        # Animation
+        # Animation (sprites face left, use pre-flipped frames when facing right)
         if self.is_walking:
             self.animation_timer += clock.get_time()
             if self.animation_timer > self.animation_speed:
                 self.animation_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.walk_animation)
-            self.image = self.walk_animation[self.current_frame]
+                self.current_frame = (self.current_frame + 1) % self.walk_frame_count
+            self.image = get_animation_frame('player_walk', self.current_frame, self.facing_right)
         else:
-            self.image = self.idle_image
-
-        # Flip sprite based on direction
-        if self.facing_right:
-            self.image = pygame.transform.flip(self.image, True, False)
+            self.image = get_animation_frame('player_idle', 0, self.facing_right)
 
     def draw(self, screen, camera_offset):
         """Draw player with camera offset."""
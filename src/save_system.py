@@ -1,10 +1,20 @@
 """Save/Load system for Mind of Seasons."""
 
+import base64
 import json
 import os
+import queue
+import struct
+import threading
+import time
+import zlib
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
+from src.utils.atomic_write import write_atomic
+
 
 def get_save_dir() -> Path:
     """Get the save directory path, creating it if necessary."""
@@ -24,11 +34,313 @@ def get_settings_path() -> Path:
     return save_dir / 'settings.json'
 
 
+# Binary save format (version 2):
+#   header struct: magic, format version, JSON header length
+#   JSON header: all small state, plus the list of [name, length] sections
+#   sections: raw blobs in header order
+SAVE_MAGIC = b'MOSS'
+SAVE_FORMAT_VERSION = 2
+_HEADER_STRUCT = struct.Struct('<4sHI')
+
+
+# Save log (save_<slot>.log), appended to between full saves by autosave
+# checkpoints and the gameplay journal:
+#   record struct: record type, payload length, CRC32 of the payload
+#   delta payload: JSON length, JSON state, packed mask bits of the dirty box
+#   event payload: JSON gameplay event
+#   tiles payload: box struct (x0, y0, x1, y1), packed mask bits of the box
+#   generation payload: generation struct, always the first record
+# Loading stops at the first torn or corrupt record; the next full save
+# replaces the snapshot and removes the log. Every full save has a new
+# generation number in its header and a log only applies to the snapshot
+# of its generation, so a log left behind by a crash during a full save is
+# never replayed on top of the newer snapshot.
+_RECORD_STRUCT = struct.Struct('<BII')
+_LENGTH_STRUCT = struct.Struct('<I')
+_BOX_STRUCT = struct.Struct('<4H')
+_GENERATION_STRUCT = struct.Struct('<Q')
+RECORD_DELTA = 1
+RECORD_EVENT = 2
+RECORD_TILES = 3
+RECORD_GENERATION = 4
+
+# Journal size that triggers compaction into a full save
+JOURNAL_COMPACT_SIZE = 256 * 1024
+
+# Main thread time allowed per autosave checkpoint or journal flush
+SAVE_BUDGET_MS = 1.0
+
+
 def _get_save_path(slot: int) -> Path:
     """Get the path for a specific save slot."""
+    return get_save_dir() / f'save_{slot}.sav'
+
+
+def _get_index_path(slot: int) -> Path:
+    """Get the path of the small preview index written next to a save."""
+    return get_save_dir() / f'save_{slot}.idx'
+
+
+def _get_log_path(slot: int) -> Path:
+    """Get the path of the delta log kept next to a save."""
+    return get_save_dir() / f'save_{slot}.log'
+
+
+def _get_legacy_save_path(slot: int) -> Path:
+    """Get the path of a JSON save written before the binary format."""
     return get_save_dir() / f'save_{slot}.json'
 
 
+def _decode_mask(mask: dict | None) -> dict | None:
+    """Decode a base64 exploration mask from a 1.1.0 JSON save."""
+    if not mask:
+        return None
+    return {
+        'width': mask['width'],
+        'height': mask['height'],
+        'bits': base64.b64decode(mask['bits']),
+    }
+
+
+def _pack_positions(positions) -> bytes:
+    """Pack (x, y) tile positions as little-endian uint16 pairs."""
+    flat = [int(v) for pos in positions for v in pos[:2]]
+    return struct.pack(f'<{len(flat)}H', *flat)
+
+
+def _unpack_positions(data: bytes) -> list:
+    """Unpack positions written by _pack_positions as [x, y] lists."""
+    flat = struct.unpack(f'<{len(data) // 2}H', data)
+    return [[flat[i], flat[i + 1]] for i in range(0, len(flat), 2)]
+
+
+def _serialize_save(save_data: dict) -> bytes:
+    """Serialize save data into the binary save format."""
+    header = dict(save_data)
+    sections = []
+
+    mask = header.pop('visited_mask', None)
+    if mask:
+        header['visited_mask'] = {'width': mask['width'], 'height': mask['height']}
+        sections.append(('visited_mask', zlib.compress(mask['bits'], 6)))
+
+    cats = dict(header.get('cats', {}))
+    sections.append(('cat_positions', _pack_positions(cats.pop('remaining_positions', []))))
+    header['cats'] = cats
+
+    collectibles = dict(header.get('collectibles', {}))
+    sections.append(('collectible_positions', _pack_positions(collectibles.pop('remaining_positions', []))))
+    header['collectibles'] = collectibles
+
+    header['sections'] = [[name, len(blob)] for name, blob in sections]
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+
+    parts = [_HEADER_STRUCT.pack(SAVE_MAGIC, SAVE_FORMAT_VERSION, len(header_bytes)), header_bytes]
+    parts.extend(blob for _, blob in sections)
+    return b''.join(parts)
+
+
+def _deserialize_save(data: bytes) -> dict:
+    """Deserialize the binary save format back into a save data dict."""
+    magic, version, header_length = _HEADER_STRUCT.unpack_from(data, 0)
+    if magic != SAVE_MAGIC:
+        raise ValueError("not a Mind of Seasons save file")
+    if version > SAVE_FORMAT_VERSION:
+        raise ValueError(f"save format {version} is newer than supported ({SAVE_FORMAT_VERSION})")
+
+    offset = _HEADER_STRUCT.size
+    save_data = json.loads(data[offset:offset + header_length].decode('utf-8'))
+    offset += header_length
+
+    sections = {}
+    for name, length in save_data.pop('sections', []):
+        sections[name] = data[offset:offset + length]
+        offset += length
+
+    if 'visited_mask' in sections and save_data.get('visited_mask'):
+        save_data['visited_mask']['bits'] = zlib.decompress(sections['visited_mask'])
+    if 'cat_positions' in sections:
+        save_data.setdefault('cats', {})['remaining_positions'] = _unpack_positions(sections['cat_positions'])
+    if 'collectible_positions' in sections:
+        save_data.setdefault('collectibles', {})['remaining_positions'] = _unpack_positions(
+            sections['collectible_positions'])
+
+    return save_data
+
+
+def _read_save_generation(slot: int) -> int:
+    """Generation of the slot's full save, read from its header (0 if it has none)."""
+    with open(_get_save_path(slot), 'rb') as f:
+        magic, _, header_length = _HEADER_STRUCT.unpack(f.read(_HEADER_STRUCT.size))
+        if magic != SAVE_MAGIC:
+            raise ValueError("not a Mind of Seasons save file")
+        return json.loads(f.read(header_length).decode('utf-8')).get('generation', 0)
+
+
+def _load_legacy_save(save_path: Path) -> dict:
+    """Load a JSON save (formats 1.0.0 and 1.1.0)."""
+    with open(save_path, 'r', encoding='utf-8') as f:
+        save_data = json.load(f)
+
+    # Saves before 1.1.0 store 'visited_tiles' as a list of [x, y] instead
+    if save_data.get('visited_mask'):
+        save_data['visited_mask'] = _decode_mask(save_data['visited_mask'])
+
+    return save_data
+
+
+def _encode_record(record_type: int, payload: bytes) -> bytes:
+    """Frame a log record payload."""
+    return _RECORD_STRUCT.pack(record_type, len(payload), zlib.crc32(payload)) + payload
+
+
+def _encode_delta(state: dict, box, bits: bytes) -> bytes:
+    """Encode a delta record: small state plus the revealed mask box."""
+    header = dict(state, mask_box=list(box) if box else None)
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    return _encode_record(RECORD_DELTA, _LENGTH_STRUCT.pack(len(header_bytes)) + header_bytes + bits)
+
+
+def _log_generation(records: list) -> int:
+    """Generation of the snapshot a parsed log applies to (0 for logs without one)."""
+    if records and records[0][0] == RECORD_GENERATION:
+        return _GENERATION_STRUCT.unpack(records[0][1])[0]
+    return 0
+
+
+def _head_generation(head: bytes) -> int:
+    """Generation from the first bytes of a log (see _log_generation)."""
+    if len(head) == _RECORD_STRUCT.size + _GENERATION_STRUCT.size:
+        record_type, length, crc = _RECORD_STRUCT.unpack_from(head, 0)
+        payload = head[_RECORD_STRUCT.size:]
+        if record_type == RECORD_GENERATION and length == len(payload) and zlib.crc32(payload) == crc:
+            return _GENERATION_STRUCT.unpack(payload)[0]
+    return 0
+
+
+def _read_log(data: bytes) -> tuple[list, int]:
+    """
+    Parse log records as (type, payload), stopping at a torn or corrupt one.
+
+    Returns:
+        The records and the length of the valid part of the log
+    """
+    records = []
+    offset = 0
+    while offset + _RECORD_STRUCT.size <= len(data):
+        record_type, length, crc = _RECORD_STRUCT.unpack_from(data, offset)
+        payload = data[offset + _RECORD_STRUCT.size:offset + _RECORD_STRUCT.size + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            print("Warning: Ignoring torn save log tail")
+            break
+        records.append((record_type, payload))
+        offset += _RECORD_STRUCT.size + length
+    return records, offset
+
+
+def _apply_delta(save_data: dict, payload: bytes):
+    """
+    Apply a delta record's state on top of loaded save data.
+
+    Returns:
+        The record's revealed (box, bits), or None
+    """
+    (header_length,) = _LENGTH_STRUCT.unpack_from(payload, 0)
+    start = _LENGTH_STRUCT.size
+    delta = json.loads(payload[start:start + header_length].decode('utf-8'))
+    bits = payload[start + header_length:]
+
+    box = delta.pop('mask_box', None)
+    save_data.update(delta)
+    return (box, bits) if box else None
+
+
+def _reveal_boxes(save_data: dict, reveals: list):
+    """OR the packed visited bits of tile boxes into the saved mask (unpacked once)."""
+    mask = save_data.get('visited_mask')
+    if not mask or not reveals:
+        return
+    width, height = mask['width'], mask['height']
+    visited = np.unpackbits(np.frombuffer(mask['bits'], dtype=np.uint8), count=width * height)
+    visited = visited.reshape(height, width)
+    for (x0, y0, x1, y1), bits in reveals:
+        revealed = np.unpackbits(np.frombuffer(bits, dtype=np.uint8), count=(x1 - x0) * (y1 - y0))
+        visited[y0:y1, x0:x1] |= revealed.reshape(y1 - y0, x1 - x0)
+    mask['bits'] = np.packbits(visited).tobytes()
+
+
+def _apply_event(save_data: dict, event: dict):
+    """Apply a journaled gameplay event. Events are idempotent."""
+    kind = event.get('event')
+    player = save_data.setdefault('player', {})
+    cats = save_data.setdefault('cats', {})
+    collectibles = save_data.setdefault('collectibles', {})
+
+    if kind == 'cat_picked_up':
+        position = event['position']
+        cats['remaining_positions'] = [pos for pos in cats.get('remaining_positions', [])
+                                       if list(pos[:2]) != position]
+        player['carried_cat'] = event['cat']
+    elif kind == 'cat_stored':
+        stored = cats.setdefault('stored', [])
+        if event['cat'] not in stored:
+            stored.append(event['cat'])
+        player['carried_cat'] = None
+    elif kind == 'item_collected':
+        position = event['position']
+        collectibles['remaining_positions'] = [pos for pos in collectibles.get('remaining_positions', [])
+                                               if list(pos[:2]) != position]
+        collected = collectibles.setdefault('collected', [])
+        if event['item'] not in collected:
+            collected.append(event['item'])
+    elif kind == 'coffee_brewed':
+        player['has_coffee'] = True
+    elif kind == 'coffee_drunk':
+        player['has_coffee'] = False
+
+
+def _replay_log(slot: int, save_data: dict):
+    """Apply the slot's delta log, if any, on top of its last full save."""
+    try:
+        with open(_get_log_path(slot), 'rb') as f:
+            records, _ = _read_log(f.read())
+    except FileNotFoundError:
+        return
+    if _log_generation(records) != save_data.get('generation', 0):
+        return  # Left over from an older snapshot
+    reveals = []  # Mask boxes, applied together at the end
+    for record_type, payload in records:
+        if record_type == RECORD_DELTA:
+            reveal = _apply_delta(save_data, payload)
+            if reveal is not None:
+                reveals.append(reveal)
+        elif record_type == RECORD_EVENT:
+            _apply_event(save_data, json.loads(payload.decode('utf-8')))
+        elif record_type == RECORD_TILES:
+            reveals.append((_BOX_STRUCT.unpack_from(payload, 0), payload[_BOX_STRUCT.size:]))
+    _reveal_boxes(save_data, reveals)
+
+
+def _repair_log(slot: int):
+    """Cut a torn tail off the slot's log so new records aren't appended after it."""
+    log_path = _get_log_path(slot)
+    if not log_path.exists():
+        return
+    with open(log_path, 'r+b') as f:
+        data = f.read()
+        _, valid_length = _read_log(data)
+        if valid_length < len(data):
+            f.truncate(valid_length)
+
+
+def _get_log_size(slot: int) -> int:
+    """Size of the slot's delta log, 0 if there is none."""
+    try:
+        return _get_log_path(slot).stat().st_size
+    except OSError:
+        return 0
+
+
 def save_game(slot: int, game_state: dict) -> bool:
     """
     Save game state to a slot.
@@ -42,11 +354,24 @@ def save_game(slot: int, game_state: dict) -> bool:
     """
     try:
         save_path = _get_save_path(slot)
+        visited_mask = game_state.get('visited_mask')
+        if visited_mask and 'visited' in visited_mask:
+            # Bool mask copied by the game: packed here, off the main thread
+            visited_mask = {
+                'width': visited_mask['width'],
+                'height': visited_mask['height'],
+                'bits': np.packbits(visited_mask['visited']).tobytes(),
+            }
+        try:
+            generation = _read_save_generation(slot) + 1
+        except (OSError, ValueError):
+            generation = 1
 
         # Add metadata
         save_data = {
-            'version': '1.0.0',
+            'version': '2.0.0',
             'slot': slot,
+            'generation': generation,
             'created': game_state.get('created', datetime.now().isoformat()),
             'last_saved': datetime.now().isoformat(),
             'play_time': game_state.get('play_time', 0),
@@ -55,11 +380,22 @@ def save_game(slot: int, game_state: dict) -> bool:
             'player': game_state.get('player', {}),
             'cats': game_state.get('cats', {}),
             'collectibles': game_state.get('collectibles', {}),
-            'visited_tiles': game_state.get('visited_tiles', []),
+            'visited_mask': visited_mask,
         }
 
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, indent=2)
+        write_atomic(save_path, _serialize_save(save_data))
+
+        # The full save contains everything logged so far
+        log_path = _get_log_path(slot)
+        if log_path.exists():
+            log_path.unlink()
+
+        _write_index(slot, _build_save_info(slot, save_data))
+
+        # The binary save replaces an older JSON one
+        legacy_path = _get_legacy_save_path(slot)
+        if legacy_path.exists():
+            legacy_path.unlink()
 
         return True
     except Exception as e:
@@ -67,6 +403,151 @@ def save_game(slot: int, game_state: dict) -> bool:
         return False
 
 
+def append_delta(slot: int, state: dict, box=None, bits: bytes | np.ndarray = b'') -> bool:
+    """
+    Append a delta checkpoint to a slot's log.
+
+    Args:
+        slot: Save slot number (1-3)
+        state: Small state replacing the saved values (player, cats, ...)
+        box: Tiles (x0, y0, x1, y1) revealed since the last checkpoint, or None
+        bits: Bit-packed visited mask of that box, row-major, or the box's
+            bool mask (packed here, on the save worker)
+
+    Returns:
+        True if the delta was written, False otherwise
+    """
+    if isinstance(bits, np.ndarray):
+        bits = np.packbits(bits).tobytes()
+    summary = dict(state, last_saved=datetime.now().isoformat())
+    state = dict(summary)
+    state.pop('explored_tiles', None)  # Only for the index; the mask boxes are replayed
+    return append_records(slot, _encode_delta(state, box, bits), summary)
+
+
+def _encode_journal(entries: list) -> bytes:
+    """Encode journal entries (see SaveJournal) as framed records."""
+    records = []
+    for record_type, data in entries:
+        if record_type == RECORD_TILES:
+            (x0, y0, x1, y1), visited = data
+            payload = _BOX_STRUCT.pack(x0, y0, x1, y1) + np.packbits(visited).tobytes()
+        else:
+            payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        records.append(_encode_record(record_type, payload))
+    return b''.join(records)
+
+
+def append_journal(slot: int, entries: list, summary: dict | None = None) -> bool:
+    """Encode journal entries and append them to a slot's log (see append_records)."""
+    return append_records(slot, _encode_journal(entries), summary)
+
+
+def append_records(slot: int, records: bytes, summary: dict | None = None) -> bool:
+    """
+    Append encoded records to a slot's log with a single fsync.
+
+    Args:
+        slot: Save slot number (1-3)
+        records: Framed records (see _encode_record)
+        summary: Optional state the slot is in after these records (without
+            the mask, with 'explored_tiles'); keeps the preview index current
+
+    Returns:
+        True if the records were written, False otherwise
+    """
+    try:
+        if not _get_save_path(slot).exists():
+            return False  # Records need a full save to apply to
+        generation = _read_save_generation(slot)
+
+        with open(_get_log_path(slot), 'a+b') as f:
+            # Drop a log left over from an older snapshot
+            f.seek(0)
+            head = f.read(_RECORD_STRUCT.size + _GENERATION_STRUCT.size)
+            old_log_size = f.seek(0, os.SEEK_END)
+            if old_log_size and _head_generation(head) != generation:
+                f.truncate(0)
+                old_log_size = -1  # The index doesn't describe this log
+            if old_log_size <= 0:
+                records = _encode_record(RECORD_GENERATION, _GENERATION_STRUCT.pack(generation)) + records
+            f.write(records)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if summary is not None:
+            _update_index(slot, old_log_size, summary)
+        return True
+    except Exception as e:
+        print(f"Error writing save log: {e}")
+        return False
+
+
+# Background save worker
+_save_jobs = queue.Queue()
+_save_results = queue.Queue()
+_save_thread = None
+
+
+def _save_worker():
+    """Serialize and write queued saves and deltas off the main thread, in order."""
+    while True:
+        write, args, callback = _save_jobs.get()
+        try:
+            success = write(*args)
+        except Exception as e:
+            # Keep the worker alive: wait_for_saves() relies on it draining the queue
+            print(f"Error in save worker: {e}")
+            success = False
+        try:
+            _save_results.put((callback, success))
+        finally:
+            _save_jobs.task_done()
+
+
+def _queue_save_job(write, args, callback):
+    """Queue a write for the background save worker, starting it if needed."""
+    global _save_thread
+    if _save_thread is None:
+        _save_thread = threading.Thread(target=_save_worker, name='save-worker', daemon=True)
+        _save_thread.start()
+    _save_jobs.put((write, args, callback))
+
+
+def save_game_async(slot: int, game_state: dict, callback=None):
+    """
+    Queue a save to be written by the background save worker.
+
+    Args:
+        slot: Save slot number (1-3)
+        game_state: Snapshot of the game state; must not be modified afterwards
+        callback: Optional function(success) run by process_save_results
+    """
+    _queue_save_job(save_game, (slot, game_state), callback)
+
+
+def append_delta_async(slot: int, state: dict, box=None, bits: bytes | np.ndarray = b'', callback=None):
+    """Queue a delta checkpoint (see append_delta) for the background save worker."""
+    _queue_save_job(append_delta, (slot, state, box, bits), callback)
+
+
+def process_save_results():
+    """Run callbacks of finished saves. Call once per frame from the main loop."""
+    while True:
+        try:
+            callback, success = _save_results.get_nowait()
+        except queue.Empty:
+            return
+        if callback is not None:
+            callback(success)
+
+
+def wait_for_saves():
+    """Block until all queued saves are written, then run their callbacks."""
+    _save_jobs.join()
+    process_save_results()
+
+
 def load_game(slot: int) -> dict | None:
     """
     Load game state from a slot.
@@ -80,13 +561,18 @@ def load_game(slot: int) -> dict | None:
     try:
         save_path = _get_save_path(slot)
 
-        if not save_path.exists():
-            return None
+        if save_path.exists():
+            with open(save_path, 'rb') as f:
+                save_data = _deserialize_save(f.read())
+            _replay_log(slot, save_data)
+            return save_data
 
-        with open(save_path, 'r', encoding='utf-8') as f:
-            save_data = json.load(f)
+        # Migration path for JSON saves
+        legacy_path = _get_legacy_save_path(slot)
+        if legacy_path.exists():
+            return _load_legacy_save(legacy_path)
 
-        return save_data
+        return None
     except Exception as e:
         print(f"Error loading game: {e}")
         return None
@@ -103,10 +589,10 @@ def delete_save(slot: int) -> bool:
         True if deletion was successful, False otherwise
     """
     try:
-        save_path = _get_save_path(slot)
-
-        if save_path.exists():
-            save_path.unlink()
+        for save_path in (_get_save_path(slot), _get_legacy_save_path(slot), _get_index_path(slot),
+                          _get_log_path(slot)):
+            if save_path.exists():
+                save_path.unlink()
 
         return True
     except Exception as e:
@@ -114,22 +600,8 @@ def delete_save(slot: int) -> bool:
         return False
 
 
-def get_save_info(slot: int) -> dict | None:
-    """
-    Get preview info for a save slot (without loading full state).
-
-    Args:
-        slot: Save slot number (1-3)
-
-    Returns:
-        Dictionary with slot preview info, or None if slot is empty
-    """
-    save_data = load_game(slot)
-
-    if save_data is None:
-        return None
-
-    # Extract preview info
+def _build_save_info(slot: int, save_data: dict) -> dict:
+    """Compute the slot preview info shown in the menu from full save data."""
     cats_data = save_data.get('cats', {})
     stored_cats = len(cats_data.get('stored', []))
     total_cats = 5  # Fixed number of cats
@@ -138,11 +610,18 @@ def get_save_info(slot: int) -> dict | None:
     collected_collectibles = len(collectibles_data.get('collected', []))
     total_collectibles = 10  # Fixed number of collectibles
 
-    # Map exploration percentage
-    visited_tiles = save_data.get('visited_tiles', [])
+    # Map exploration percentage (bit count of the mask, a count from the
+    # game, or old tile list)
+    visited_mask = save_data.get('visited_mask')
+    if visited_mask:
+        explored_tiles = int.from_bytes(visited_mask['bits'], 'big').bit_count()
+    elif 'explored_tiles' in save_data:
+        explored_tiles = save_data['explored_tiles']
+    else:
+        explored_tiles = len(save_data.get('visited_tiles', []))
     map_size = save_data.get('map_size', [600, 600])
     total_tiles = map_size[0] * map_size[1]
-    exploration_percent = int((len(visited_tiles) / total_tiles) * 100) if total_tiles > 0 else 0
+    exploration_percent = int((explored_tiles / total_tiles) * 100) if total_tiles > 0 else 0
 
     # Format play time
     play_time_seconds = save_data.get('play_time', 0)
@@ -159,10 +638,290 @@ def get_save_info(slot: int) -> dict | None:
         'play_time': play_time_seconds,
         'play_time_formatted': f"{minutes}:{seconds:02d}",
         'is_complete': stored_cats >= total_cats,
+        'created': save_data.get('created', ''),
         'last_saved': save_data.get('last_saved', save_data.get('created', '')),
     }
 
 
+def _write_index(slot: int, info: dict, save_mtime_ns: int | None = None, log_size: int | None = None):
+    """
+    Write the preview index for a slot.
+
+    The index is tied to one version of the save file and its log: pass the
+    save mtime and log size observed before reading the data the info was
+    built from, or leave them out if the caller just wrote the files.
+    """
+    index = {
+        'info': info,
+        'save_mtime_ns': save_mtime_ns if save_mtime_ns is not None else _get_save_path(slot).stat().st_mtime_ns,
+        'log_size': log_size if log_size is not None else _get_log_size(slot),
+    }
+    write_atomic(_get_index_path(slot), json.dumps(index).encode('utf-8'))
+
+
+def _load_index(slot: int) -> dict | None:
+    """Read a slot's index file as is, or None if it is missing or unreadable."""
+    try:
+        with open(_get_index_path(slot), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _read_index(slot: int) -> dict | None:
+    """Read a slot's preview info, or None if the index is missing or stale."""
+    index = _load_index(slot)
+    try:
+        if index is None or index.get('save_mtime_ns') != _get_save_path(slot).stat().st_mtime_ns:
+            return None
+        if index.get('log_size', 0) != _get_log_size(slot):
+            return None
+        return index['info']
+    except (OSError, KeyError):
+        return None
+
+
+def _update_index(slot: int, old_log_size: int, summary: dict):
+    """Carry the index over an append, if it was current for the log before it."""
+    index = _load_index(slot)
+    try:
+        if index is None or index.get('log_size', 0) != old_log_size:
+            return  # Already stale: rebuilt from a full load when needed
+        if index.get('save_mtime_ns') != _get_save_path(slot).stat().st_mtime_ns:
+            return
+        info = _build_save_info(slot, dict({'last_saved': datetime.now().isoformat()}, **summary))
+        info['created'] = index['info'].get('created', info['created'])
+        _write_index(slot, info, index['save_mtime_ns'])
+    except (OSError, KeyError) as e:
+        print(f"Warning: Could not update save index: {e}")
+
+
+def get_save_info(slot: int) -> dict | None:
+    """
+    Get preview info for a save slot (without loading full state).
+
+    Reads the slot's index file. Saves without a valid index (legacy JSON
+    saves, or an interrupted write) are loaded once and the index is rebuilt.
+
+    Args:
+        slot: Save slot number (1-3)
+
+    Returns:
+        Dictionary with slot preview info, or None if slot is empty
+    """
+    info = _read_index(slot)
+    if info is not None:
+        return info
+
+    # Versions of the files the info is built from (may change while loading)
+    try:
+        save_mtime_ns = _get_save_path(slot).stat().st_mtime_ns
+    except OSError:
+        save_mtime_ns = None
+    log_size = _get_log_size(slot)
+
+    save_data = load_game(slot)
+    if save_data is None:
+        return None
+
+    info = _build_save_info(slot, save_data)
+    if save_mtime_ns is not None:
+        try:
+            _write_index(slot, info, save_mtime_ns, log_size)
+        except OSError as e:
+            print(f"Warning: Could not write save index: {e}")
+    return info
+
+
+class SaveJournal:
+    """
+    Append-only journal of gameplay events for the slot being played.
+
+    Events (tiles revealed, cat picked up or stored, item collected, coffee
+    brewed or drunk) are buffered as plain data (revealed tiles as a copy of
+    their box of the mask); flush() hands them to the save worker, which
+    encodes them, at most every `flush_interval` seconds, or right away for
+    anything but revealed tiles. Once the log passes `compact_size` bytes
+    (or if the slot has no full save yet to replay the log on), a full save
+    is queued instead, which removes the log. A flush taking longer than
+    `budget_ms` on the main thread is reported.
+    """
+
+    def __init__(self, flush_interval=1.0, compact_size=JOURNAL_COMPACT_SIZE, budget_ms=SAVE_BUDGET_MS):
+        self.flush_interval = flush_interval
+        self.compact_size = compact_size
+        self.budget_ms = budget_ms
+        self.slot = None
+        self.last_cost_ms = 0.0  # Main thread time of the last flush
+
+        self._pending = []
+        self._urgent = False
+        self._last_flush = 0.0
+        self._log_size = 0
+        self._needs_snapshot = False
+
+    def start(self, slot):
+        """Start journaling a slot (after a new game or load)."""
+        self.slot = slot
+        self._pending = []
+        self._urgent = False
+        self._last_flush = time.time()
+        try:
+            _repair_log(slot)
+        except OSError as e:
+            print(f"Warning: Could not repair save log: {e}")
+        self._log_size = _get_log_size(slot)
+        self._needs_snapshot = not _get_save_path(slot).exists()
+
+    def stop(self):
+        """Stop journaling, dropping unflushed events."""
+        self.slot = None
+        self._pending = []
+
+    def compacted(self):
+        """Note that a full save was queued: it covers every event so far."""
+        self._pending = []
+        self._urgent = False
+        self._log_size = 0
+        self._needs_snapshot = False
+
+    def record(self, event, **data):
+        """Journal a gameplay event, e.g. record('cat_stored', cat=2)."""
+        if self.slot is None:
+            return
+        self._pending.append((RECORD_EVENT, dict(data, event=event)))
+        self._urgent = True
+
+    def record_tiles(self, dirty, visited):
+        """Journal newly revealed tiles (x0, y0, x1, y1), exclusive."""
+        if self.slot is None or dirty is None:
+            return
+        x0, y0, x1, y1 = dirty
+        self._pending.append((RECORD_TILES, ((x0, y0, x1, y1), visited[y0:y1, x0:x1].copy())))
+
+    def flush(self, capture_state):
+        """
+        Hand buffered events to the save worker if due; compact if the log is large.
+
+        Args:
+            capture_state: function(include_mask) returning a game state snapshot
+        """
+        if self.slot is None or not self._pending:
+            return
+        now = time.time()
+        if not self._urgent and now - self._last_flush < self.flush_interval:
+            return
+        self._last_flush = now
+        self._urgent = False
+
+        start = time.perf_counter()
+        if self._needs_snapshot or self._log_size >= self.compact_size:
+            save_game_async(self.slot, capture_state(True))
+            self.compacted()
+        else:
+            summary = capture_state(False)
+            summary.pop('visited_mask', None)
+            # Written so far (queued records show up on a later flush). Read
+            # before queueing, as the woken worker competes for the GIL
+            self._log_size = _get_log_size(self.slot)
+            _queue_save_job(append_journal, (self.slot, self._pending, summary), None)
+            self._pending = []
+
+        self.last_cost_ms = (time.perf_counter() - start) * 1000
+        if self.last_cost_ms > self.budget_ms:
+            print(f"Warning: Save journal flush took {self.last_cost_ms:.2f} ms (budget {self.budget_ms:.1f} ms)")
+
+
+class AutosaveScheduler:
+    """
+    Periodic background autosave for the slot being played.
+
+    Every `interval` seconds a checkpoint is queued for the save worker. Most
+    checkpoints are deltas: the small state (player, cats, collectibles, play
+    time) plus only the part of the exploration mask revealed since the last
+    checkpoint, appended to the slot's log. The first checkpoint and every
+    `compact_every`-th one are full saves, which compact the log away.
+
+    Only the capture runs on the main thread, and it only copies (the mask,
+    or just its dirty box); packing, encoding and writing happen on the save
+    worker, which keeps a checkpoint within `budget_ms`. If one still takes
+    longer it is reported and the next one is pushed back by an interval.
+    """
+
+    def __init__(self, interval=30.0, compact_every=10, budget_ms=SAVE_BUDGET_MS):
+        self.interval = interval
+        self.compact_every = compact_every
+        self.budget_ms = budget_ms
+        self.slot = None
+        self.last_cost_ms = 0.0  # Main thread time of the last checkpoint
+
+        self._last_checkpoint = 0.0
+        self._deltas_since_full = 0
+        self._needs_full = True
+        self._dirty = None
+
+    def start(self, slot):
+        """Start autosaving a slot (after a new game or load)."""
+        self.slot = slot
+        self._last_checkpoint = time.time()
+        self._deltas_since_full = 0
+        self._needs_full = True
+        self._dirty = None
+
+    def stop(self):
+        """Stop autosaving (e.g. back in the main menu)."""
+        self.slot = None
+
+    def mark_revealed(self, dirty):
+        """Grow the dirty box by newly revealed tiles (x0, y0, x1, y1), exclusive."""
+        if dirty is None:
+            return
+        if self._dirty is None:
+            self._dirty = dirty
+        else:
+            self._dirty = (min(self._dirty[0], dirty[0]), min(self._dirty[1], dirty[1]),
+                           max(self._dirty[2], dirty[2]), max(self._dirty[3], dirty[3]))
+
+    def update(self, capture_state, visited):
+        """
+        Queue a checkpoint if one is due. Returns True if it was a full save.
+
+        Args:
+            capture_state: function(include_mask) returning a game state snapshot
+            visited: Current bool exploration mask, indexed [tile_y, tile_x]
+        """
+        if self.slot is None or self.interval <= 0:
+            return False
+        now = time.time()
+        if now - self._last_checkpoint < self.interval:
+            return False
+        self._last_checkpoint = now
+
+        start = time.perf_counter()
+        full = self._needs_full or self._deltas_since_full >= self.compact_every
+        if full:
+            save_game_async(self.slot, capture_state(True))
+            self._needs_full = False
+            self._deltas_since_full = 0
+        else:
+            state = capture_state(False)
+            state.pop('visited_mask', None)
+            revealed = b''
+            if self._dirty is not None:
+                # Copy of the dirty box only; packed by the save worker
+                x0, y0, x1, y1 = self._dirty
+                revealed = visited[y0:y1, x0:x1].copy()
+            append_delta_async(self.slot, state, self._dirty, revealed)
+            self._deltas_since_full += 1
+        self._dirty = None
+        self.last_cost_ms = (time.perf_counter() - start) * 1000
+        if self.last_cost_ms > self.budget_ms:
+            print(f"Warning: Autosave took {self.last_cost_ms:.2f} ms (budget {self.budget_ms:.1f} ms), "
+                  f"deferring the next one")
+            self._last_checkpoint = now + self.interval
+        return full
+
+
 def list_saves() -> list[dict | None]:
     """
     Get info for all save slots.
@@ -209,6 +968,9 @@ def load_settings() -> dict:
         'music_volume': 30,
         'sfx_volume': 100,
         'tutorial_completed': False,
+        'enemy_ai_worker': False,
+        'autosave_interval': 30,  # Seconds between autosaves, 0 disables
+        'asset_cache_budget_mb': 64,  # Image cache memory budget
     }
 
     try:
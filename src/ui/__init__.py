@@ -9,3 +9,4 @@ from src.ui.options_menu import OptionsMenu
 from src.ui.credits_screen import CreditsScreen
 from src.ui.tutorial import TutorialSystem
 from src.ui.minimap import Minimap
+from src.ui.world_map import WorldMap
@@ -1,12 +1,11 @@
 # Lore data loader - loads cats and collectibles from JSON files
 import json
-from src.utils import resource_path
+from src.utils import get_bytes, LazyList
 
 
 def _load_json(filename):
     """Load JSON data from file."""
-    with open(resource_path(filename), 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = json.loads(get_bytes(filename).decode('utf-8'))
     # Convert color arrays to tuples
     for item in data:
         if 'color' in item:
@@ -14,6 +13,6 @@ def _load_json(filename):
     return data
 
 
-# Load data from JSON files
-CATS_LORE = _load_json('data/cats.json')
-COLLECTIBLES_LORE = _load_json('data/collectibles.json')
+# Data from JSON files, loaded on first use
+CATS_LORE = LazyList(lambda: _load_json('data/cats.json'))
+COLLECTIBLES_LORE = LazyList(lambda: _load_json('data/collectibles.json'))
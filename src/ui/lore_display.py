@@ -1,9 +1,15 @@
 import pygame
-from src.utils import get_font
+from src.utils import get_font, get_derived, get_scaled
 
 
 def create_placeholder(size, color, name):
-    """Create a colored placeholder image with name."""
+    """Get a colored placeholder image with name (cached per size, color and name)."""
+    size, color = tuple(size), tuple(color)
+    return get_derived(('placeholder', size, color, name), lambda: _render_placeholder(size, color, name))
+
+
+def _render_placeholder(size, color, name):
+    """Render a colored placeholder image with name."""
     surface = pygame.Surface(size, pygame.SRCALPHA)
     surface.fill(color)
 
@@ -64,7 +70,7 @@ class LoreDisplay:
 
         # Use provided image or create placeholder
         if item_image:
-            self.current_image = pygame.transform.scale(item_image, self.image_size)
+            self.current_image = get_scaled(item_image, self.image_size)
         else:
             self.current_image = create_placeholder(
                 self.image_size,
@@ -1,17 +1,19 @@
 """Minimap with fog of war system."""
 
+import numpy as np
 import pygame
 
 
 class Minimap:
     """A minimap that reveals as the player explores."""
 
-    def __init__(self, screen_width, screen_height, map_width, map_height, tile_size):
+    def __init__(self, screen_width, screen_height, map_width, map_height, tile_size, map_data=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.map_width = map_width
         self.map_height = map_height
         self.tile_size = tile_size
+        self.map_data = map_data
 
         # Minimap display settings
         self.size = 180  # Minimap size in pixels
@@ -22,8 +24,14 @@ class Minimap:
         # How many tiles player reveals around them (radius)
         self.reveal_radius = 8
 
-        # Visited tiles set - stores (tile_x, tile_y) tuples
-        self.visited_tiles = set()
+        # Precomputed circular reveal stencil, (2r+1) x (2r+1)
+        offsets = np.arange(-self.reveal_radius, self.reveal_radius + 1)
+        self._reveal_stencil = offsets[:, None] ** 2 + offsets[None, :] ** 2 <= self.reveal_radius ** 2
+        self._last_player_tile = None
+
+        # Visited tiles mask, indexed [tile_y, tile_x], plus a running count
+        self.visited = np.zeros((map_height, map_width), dtype=bool)
+        self.explored_count = 0
 
         # Scale factor: how many map tiles per minimap pixel
         self.scale = self.size / max(map_width, map_height)
@@ -38,9 +46,20 @@ class Minimap:
         self.color_border = (60, 50, 40)
         self.color_bg = (15, 15, 20, 200)  # Semi-transparent background
 
-        # Pre-render static elements
-        self._surface = None
+        # Tile grid (True = path) and the first tile of each minimap pixel
+        # column/row, used to downsample the map with NumPy
+        self._path_tiles = None
+        self._col_starts = self._col_ends = None
+        self._row_starts = self._row_ends = None
+        self._max_block = 1
+        self._palette = np.array([self.color_fog, self.color_grass, self.color_path], dtype=np.uint8)
+
+        # Pre-rendered frame (background + border) and persistent fog of war
+        # surface. Revealed tiles are painted once, draw() only blits them.
+        self._frame_surface = None
+        self._fog_surface = None
         self._needs_redraw = True
+        self._label_surface = None
 
     def update_position(self, screen_width, screen_height):
         """Update minimap position when screen size changes."""
@@ -50,27 +69,184 @@ class Minimap:
         self.y = self.margin
 
     def update(self, player_tile_x, player_tile_y):
-        """Update visited tiles based on player position."""
-        # Reveal tiles around player
-        for dy in range(-self.reveal_radius, self.reveal_radius + 1):
-            for dx in range(-self.reveal_radius, self.reveal_radius + 1):
-                # Circular reveal
-                if dx * dx + dy * dy <= self.reveal_radius * self.reveal_radius:
-                    tx = player_tile_x + dx
-                    ty = player_tile_y + dy
-                    if 0 <= tx < self.map_width and 0 <= ty < self.map_height:
-                        if (tx, ty) not in self.visited_tiles:
-                            self.visited_tiles.add((tx, ty))
-                            self._needs_redraw = True
+        """
+        Reveal tiles around the player and repaint them on the minimap.
+
+        Only runs when the player enters a new tile. Returns the dirty
+        bounding box (x0, y0, x1, y1) of newly revealed tiles, exclusive,
+        or None if nothing new was revealed.
+        """
+        if (player_tile_x, player_tile_y) == self._last_player_tile:
+            return None
+        self._last_player_tile = (player_tile_x, player_tile_y)
+
+        # Clip the reveal stencil to the map
+        r = self.reveal_radius
+        x0 = max(0, player_tile_x - r)
+        y0 = max(0, player_tile_y - r)
+        x1 = min(self.map_width, player_tile_x + r + 1)
+        y1 = min(self.map_height, player_tile_y + r + 1)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        stencil = self._reveal_stencil[
+            y0 - (player_tile_y - r):y1 - (player_tile_y - r),
+            x0 - (player_tile_x - r):x1 - (player_tile_x - r)
+        ]
+
+        area = self.visited[y0:y1, x0:x1]
+        revealed = stencil & ~area
+        if not revealed.any():
+            return None
+        area |= stencil
+        self.explored_count += int(np.count_nonzero(revealed))
+
+        # Tight bounding box of newly revealed tiles
+        rows = np.flatnonzero(revealed.any(axis=1))
+        cols = np.flatnonzero(revealed.any(axis=0))
+        dirty = (x0 + int(cols[0]), y0 + int(rows[0]), x0 + int(cols[-1]) + 1, y0 + int(rows[-1]) + 1)
+
+        if not self._needs_redraw:
+            self._repaint_tiles(*dirty)
+        return dirty
+
+    def is_visited(self, tile_x, tile_y):
+        """Check if a tile has been revealed."""
+        if 0 <= tile_x < self.map_width and 0 <= tile_y < self.map_height:
+            return bool(self.visited[tile_y, tile_x])
+        return False
+
+    def get_exploration_percent(self):
+        """Get explored part of the map as percentage (0-100)."""
+        total_tiles = self.map_width * self.map_height
+        return self.explored_count * 100 / total_tiles if total_tiles > 0 else 0
 
     def set_visited_tiles(self, tiles):
-        """Set visited tiles from saved data."""
-        self.visited_tiles = set(tuple(t) for t in tiles)
+        """Set visited tiles from a list of (x, y) pairs (old saves)."""
+        self.visited[:] = False
+        for tx, ty in tiles:
+            if 0 <= tx < self.map_width and 0 <= ty < self.map_height:
+                self.visited[ty, tx] = True
+        self.explored_count = int(np.count_nonzero(self.visited))
         self._needs_redraw = True
 
-    def get_visited_tiles(self):
-        """Get visited tiles for saving."""
-        return list(self.visited_tiles)
+    def set_visited_mask(self, bits):
+        """Set visited tiles from bit-packed mask bytes (see get_visited_mask)."""
+        total_tiles = self.map_width * self.map_height
+        unpacked = np.unpackbits(np.frombuffer(bits, dtype=np.uint8), count=total_tiles)
+        self.visited = unpacked.astype(bool).reshape(self.map_height, self.map_width)
+        self.explored_count = int(np.count_nonzero(self.visited))
+        self._needs_redraw = True
+
+    def get_visited_mask(self):
+        """Get visited tiles for saving as bit-packed row-major bytes."""
+        return np.packbits(self.visited).tobytes()
+
+    def get_path_tiles(self):
+        """Get the bool tile grid (True = path), indexed [tile_y, tile_x]."""
+        if self._path_tiles is None:
+            self._build_tile_grid()
+        return self._path_tiles
+
+    def _build_tile_grid(self):
+        """Build the path tile grid and pixel blocks from map data."""
+        if self.map_data:
+            self._path_tiles = np.array(self.map_data) == 'path'
+        else:
+            self._path_tiles = np.zeros((self.map_height, self.map_width), dtype=bool)
+        self._row_starts, self._row_ends = self._pixel_blocks(self._path_tiles.shape[0])
+        self._col_starts, self._col_ends = self._pixel_blocks(self._path_tiles.shape[1])
+        self._max_block = int(max(
+            (self._row_ends - self._row_starts).max(initial=1),
+            (self._col_ends - self._col_starts).max(initial=1),
+        ))
+
+    def _pixel_blocks(self, num_tiles):
+        """Tile range [start, end) covered by every minimap pixel along one axis."""
+        if num_tiles == 0:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+        tile_pixels = (np.arange(num_tiles) * self.scale).astype(np.intp)
+        starts = np.searchsorted(tile_pixels, np.arange(tile_pixels[-1] + 1))
+        ends = np.append(starts[1:], num_tiles)
+        # When scale > 1 some pixels have no tile of their own, use the next one
+        ends = np.maximum(ends, starts + 1)
+        return starts, ends
+
+    def _block_any(self, grid, starts, ends, axis):
+        """OR together each [start, end) block of a bool grid along an axis."""
+        result = np.take(grid, starts, axis=axis)
+        last = ends - 1
+        for step in range(1, self._max_block):
+            result |= np.take(grid, np.minimum(starts + step, last), axis=axis)
+        return result
+
+    def _compose(self, px0, py0, px1, py1):
+        """
+        Compute minimap pixels [px0, px1) x [py0, py1) as an RGB array.
+
+        Each pixel covers a block of tiles: it is fog if no tile in the block
+        is visited, path if any visited tile is a path, grass otherwise.
+        Returns an array indexed [x, y] as used by pygame.surfarray.
+        """
+        rows = self._row_starts[py0:py1], self._row_ends[py0:py1]
+        cols = self._col_starts[px0:px1], self._col_ends[px0:px1]
+        r0, r1 = rows[0][0], rows[1][-1]
+        c0, c1 = cols[0][0], cols[1][-1]
+
+        visited = self.visited[r0:r1, c0:c1]
+        on_path = visited & self._path_tiles[r0:r1, c0:c1]
+        row_blocks = (rows[0] - r0, rows[1] - r0)
+        col_blocks = (cols[0] - c0, cols[1] - c0)
+
+        seen = self._block_any(self._block_any(visited, *row_blocks, axis=0), *col_blocks, axis=1)
+        path = self._block_any(self._block_any(on_path, *row_blocks, axis=0), *col_blocks, axis=1)
+
+        index = seen.astype(np.uint8) + path
+        return self._palette.take(index.T, axis=0)
+
+    def _repaint_tiles(self, x0, y0, x1, y1):
+        """Repaint the minimap pixels covering tiles [x0, x1) x [y0, y1)."""
+        if self._fog_surface is None or self._path_tiles is None:
+            self._needs_redraw = True
+            return
+
+        px0, py0 = self._world_to_minimap(x0, y0)
+        px1, py1 = self._world_to_minimap(x1 - 1, y1 - 1)
+        px1 = min(px1 + 1, len(self._col_starts))
+        py1 = min(py1 + 1, len(self._row_starts))
+        if px0 >= px1 or py0 >= py1:
+            return
+
+        pixels = pygame.surfarray.pixels3d(self._fog_surface)
+        pixels[px0:px1, py0:py1] = self._compose(px0, py0, px1, py1)
+        del pixels  # Unlock the surface
+
+    def _redraw_fog(self):
+        """Rebuild the whole fog of war surface (after load or map change)."""
+        if self._fog_surface is None:
+            self._fog_surface = pygame.Surface((self.size, self.size), 0, 32)
+        if self._path_tiles is None:
+            self._build_tile_grid()
+        self._needs_redraw = False
+
+        image = np.empty((self.size, self.size, 3), dtype=np.uint8)
+        image[:] = self.color_fog
+        width, height = len(self._col_starts), len(self._row_starts)
+        if width and height:
+            image[:width, :height] = self._compose(0, 0, width, height)
+        pygame.surfarray.blit_array(self._fog_surface, image)
+
+    def _build_frame(self):
+        """Pre-render the static background, border and label."""
+        self._frame_surface = pygame.Surface((self.size + 4, self.size + 4), pygame.SRCALPHA)
+        pygame.draw.rect(self._frame_surface, self.color_bg, (0, 0, self.size + 4, self.size + 4), border_radius=8)
+        pygame.draw.rect(self._frame_surface, self.color_border, (0, 0, self.size + 4, self.size + 4), 2, border_radius=8)
+
+        try:
+            font = pygame.font.Font(None, 18)
+            self._label_surface = font.render("MAP", True, (150, 140, 130))
+        except:
+            self._label_surface = None
 
     def _world_to_minimap(self, tile_x, tile_y):
         """Convert world tile coordinates to minimap pixel coordinates."""
@@ -79,69 +255,61 @@ class Minimap:
         return mx, my
 
     def draw(self, screen, map_data, player_tile_x, player_tile_y, cabin=None, cat_positions=None):
-        """Draw the minimap."""
-        # Create surface with alpha
-        surface = pygame.Surface((self.size + 4, self.size + 4), pygame.SRCALPHA)
+        """Draw the minimap: cached fog of war plus dynamic markers."""
+        if map_data is not self.map_data:
+            self.map_data = map_data
+            self._path_tiles = None
+            self._needs_redraw = True
+        if self._frame_surface is None:
+            self._build_frame()
+        if self._needs_redraw or self._fog_surface is None:
+            self._redraw_fog()
 
-        # Draw background
-        pygame.draw.rect(surface, self.color_bg, (0, 0, self.size + 4, self.size + 4), border_radius=8)
-        pygame.draw.rect(surface, self.color_border, (0, 0, self.size + 4, self.size + 4), 2, border_radius=8)
+        # Background, border and explored terrain
+        screen.blit(self._frame_surface, (self.x, self.y))
 
         # Offset for border
-        offset = 2
-
-        # Draw fog base
-        pygame.draw.rect(surface, self.color_fog, (offset, offset, self.size, self.size))
+        offset_x = self.x + 2
+        offset_y = self.y + 2
+        screen.blit(self._fog_surface, (offset_x, offset_y))
 
-        # Draw visited tiles
-        for (tx, ty) in self.visited_tiles:
-            if 0 <= ty < len(map_data) and 0 <= tx < len(map_data[0]):
-                mx, my = self._world_to_minimap(tx, ty)
-                tile_type = map_data[ty][tx]
-                color = self.color_path if tile_type == 'path' else self.color_grass
-
-                # Draw pixel (or small rect if scale > 1)
-                pixel_size = max(1, int(self.scale))
-                pygame.draw.rect(surface, color, (offset + mx, offset + my, pixel_size, pixel_size))
+        # Keep markers inside the minimap area
+        previous_clip = screen.get_clip()
+        screen.set_clip(pygame.Rect(offset_x, offset_y, self.size, self.size))
 
         # Draw cabin if visible
         if cabin is not None:
             cabin_tx, cabin_ty = cabin.x, cabin.y
             # Check if any part of cabin is discovered
-            cabin_visible = any(
-                (cabin_tx + dx, cabin_ty + dy) in self.visited_tiles
-                for dx in range(cabin.width)
-                for dy in range(cabin.height)
-            )
+            cabin_visible = bool(self.visited[
+                max(0, cabin_ty):max(0, cabin_ty + cabin.height),
+                max(0, cabin_tx):max(0, cabin_tx + cabin.width)
+            ].any())
             if cabin_visible:
                 mx, my = self._world_to_minimap(cabin_tx, cabin_ty)
                 cabin_w = max(3, int(cabin.width * self.scale))
                 cabin_h = max(3, int(cabin.height * self.scale))
-                pygame.draw.rect(surface, self.color_cabin, (offset + mx, offset + my, cabin_w, cabin_h))
+                pygame.draw.rect(screen, self.color_cabin, (offset_x + mx, offset_y + my, cabin_w, cabin_h))
 
         # Draw discovered cats
         if cat_positions:
             for (cx, cy, _) in cat_positions:
-                if (cx, cy) in self.visited_tiles:
+                if self.is_visited(cx, cy):
                     mx, my = self._world_to_minimap(cx, cy)
-                    pygame.draw.circle(surface, self.color_cat, (offset + mx, offset + my), 3)
+                    pygame.draw.circle(screen, self.color_cat, (offset_x + mx, offset_y + my), 3)
 
         # Draw player position (always visible, pulsing)
         px, py = self._world_to_minimap(player_tile_x, player_tile_y)
         pulse = (pygame.time.get_ticks() % 1000) / 1000
         player_size = 3 + int(pulse * 2)
-        pygame.draw.circle(surface, self.color_player, (offset + px, offset + py), player_size)
+        pygame.draw.circle(screen, self.color_player, (offset_x + px, offset_y + py), player_size)
 
-        # Draw border highlight
-        pygame.draw.rect(surface, (80, 70, 60), (0, 0, self.size + 4, self.size + 4), 1, border_radius=8)
+        screen.set_clip(previous_clip)
 
-        # Blit to screen
-        screen.blit(surface, (self.x, self.y))
+        # Draw border highlight
+        pygame.draw.rect(screen, (80, 70, 60), (self.x, self.y, self.size + 4, self.size + 4), 1, border_radius=8)
 
         # Draw "MAP" label
-        try:
-            font = pygame.font.Font(None, 18)
-            label = font.render("MAP", True, (150, 140, 130))
+        if self._label_surface is not None:
+            label = self._label_surface
             screen.blit(label, (self.x + self.size // 2 - label.get_width() // 2, self.y + self.size + 6))
-        except:
-            pass
@@ -0,0 +1,274 @@
+"""Full-screen zoomable world map backed by a tile pyramid."""
+
+import math
+
+import numpy as np
+import pygame
+from src.utils import get_font
+
+
+class WorldMap:
+    """
+    Large map view (M key) of the explored terrain.
+
+    Level 0 of the pyramid has one pixel per tile, every next level halves
+    the resolution (a pixel is path if any of its 2x2 children is a visited
+    path, grass if any is visited, fog otherwise). Drawing picks the level
+    closest to the current zoom and scales only the visible part of it.
+    """
+
+    MIN_LEVEL_SIZE = 64  # Stop building levels below this many pixels
+
+    def __init__(self, screen_width, screen_height, minimap):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        # Shares the visited mask and tile grid with the minimap
+        self.minimap = minimap
+        self.is_showing = False
+
+        # Fonts
+        self.title_font = get_font(16)
+        self.hint_font = get_font(8)
+
+        # Colors (same palette as the minimap)
+        self._palette = np.array([minimap.color_fog, minimap.color_grass, minimap.color_path], dtype=np.uint8)
+        self.color_player = minimap.color_player
+        self.color_cabin = minimap.color_cabin
+        self.color_cat = minimap.color_cat
+        self.color_border = (180, 160, 120)
+
+        # Pyramid: per level a uint8 index grid (0 fog, 1 grass, 2 path) and a surface
+        self._levels = []
+        self._level_surfaces = []
+        self._built = False
+
+        # View state: center in tiles, zoom in screen pixels per tile
+        self.center = [minimap.map_width / 2, minimap.map_height / 2]
+        self.zoom = 1.0
+        self.max_zoom = 8.0
+        self.pan_speed = 12  # screen pixels per frame
+
+        # Cached scaled view, rebuilt only when view or pyramid changes
+        self._view_cache_key = None
+        self._view_surface = None
+        self._view_pos = (0, 0)
+        self._version = 0
+
+        self.update_position(screen_width, screen_height)
+
+    def update_position(self, screen_width, screen_height):
+        """Update viewport when screen size changes."""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        margin = 40
+        self.viewport = pygame.Rect(margin, margin + 20, screen_width - 2 * margin, screen_height - 2 * margin - 40)
+        self.min_zoom = min(self.viewport.width / self.minimap.map_width,
+                            self.viewport.height / self.minimap.map_height)
+        self.zoom = max(self.min_zoom, min(self.max_zoom, self.zoom))
+        self._view_cache_key = None
+
+    def show(self, player_tile_x, player_tile_y):
+        """Open the map centered on the player."""
+        if not self._built:
+            self._build()
+        self.is_showing = True
+        self.center = [player_tile_x + 0.5, player_tile_y + 0.5]
+        self._clamp_center()
+
+    def hide(self):
+        """Close the map."""
+        self.is_showing = False
+
+    def invalidate(self):
+        """Drop the pyramid (e.g. after the visited mask was replaced)."""
+        self._built = False
+        self._levels = []
+        self._level_surfaces = []
+        self._view_cache_key = None
+
+    # ------------------------------------------------------------------
+    # Pyramid
+    # ------------------------------------------------------------------
+
+    def _level0(self, x0, y0, x1, y1):
+        """Index grid of level 0 (one pixel per tile) for tiles [x0, x1) x [y0, y1)."""
+        visited = self.minimap.visited[y0:y1, x0:x1]
+        on_path = visited & self.minimap.get_path_tiles()[y0:y1, x0:x1]
+        return visited.astype(np.uint8) + on_path
+
+    @staticmethod
+    def _downsample(child, px0, py0, px1, py1):
+        """Parent pixels [px0, px1) x [py0, py1) as the max of their 2x2 children."""
+        block = child[2 * py0:2 * py1, 2 * px0:2 * px1]
+        height, width = py1 - py0, px1 - px0
+        padded = np.zeros((2 * height, 2 * width), dtype=np.uint8)
+        padded[:block.shape[0], :block.shape[1]] = block
+        return padded.reshape(height, 2, width, 2).max(axis=(1, 3))
+
+    def _build(self):
+        """Build every pyramid level from the visited mask and tile grid."""
+        width, height = self.minimap.map_width, self.minimap.map_height
+        self._levels = [self._level0(0, 0, width, height)]
+        while max(self._levels[-1].shape) > self.MIN_LEVEL_SIZE:
+            child = self._levels[-1]
+            parent_h, parent_w = (child.shape[0] + 1) // 2, (child.shape[1] + 1) // 2
+            self._levels.append(self._downsample(child, 0, 0, parent_w, parent_h))
+
+        self._level_surfaces = []
+        for level in self._levels:
+            surface = pygame.Surface((level.shape[1], level.shape[0]), 0, 32)
+            pygame.surfarray.blit_array(surface, self._palette.take(level.T, axis=0))
+            self._level_surfaces.append(surface)
+
+        self._built = True
+        self._version += 1
+
+    def mark_revealed(self, dirty):
+        """Update the pyramid for newly revealed tiles (x0, y0, x1, y1), exclusive."""
+        if not self._built or dirty is None:
+            return
+        x0, y0, x1, y1 = dirty
+
+        for index, level in enumerate(self._levels):
+            if index == 0:
+                level[y0:y1, x0:x1] = self._level0(x0, y0, x1, y1)
+            else:
+                # Parent region covering the child's dirty region
+                x0, y0 = x0 // 2, y0 // 2
+                x1, y1 = min((x1 + 1) // 2, level.shape[1]), min((y1 + 1) // 2, level.shape[0])
+                level[y0:y1, x0:x1] = self._downsample(self._levels[index - 1], x0, y0, x1, y1)
+
+            pixels = pygame.surfarray.pixels3d(self._level_surfaces[index])
+            pixels[x0:x1, y0:y1] = self._palette.take(level[y0:y1, x0:x1].T, axis=0)
+            del pixels  # Unlock the surface
+
+        self._version += 1
+
+    # ------------------------------------------------------------------
+    # Input
+    # ------------------------------------------------------------------
+
+    def _clamp_center(self):
+        """Keep the view center inside the map."""
+        self.center[0] = max(0, min(self.minimap.map_width, self.center[0]))
+        self.center[1] = max(0, min(self.minimap.map_height, self.center[1]))
+
+    def _set_zoom(self, zoom):
+        self.zoom = max(self.min_zoom, min(self.max_zoom, zoom))
+
+    def update(self, keys, events):
+        """Handle pan and zoom input while the map is open."""
+        if not self.is_showing:
+            return
+
+        # Pan (speed constant in screen pixels)
+        step = self.pan_speed / self.zoom
+        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            self.center[0] -= step
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            self.center[0] += step
+        if keys[pygame.K_UP] or keys[pygame.K_w]:
+            self.center[1] -= step
+        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+            self.center[1] += step
+
+        # Zoom (keys held or mouse wheel)
+        if keys[pygame.K_EQUALS] or keys[pygame.K_KP_PLUS] or keys[pygame.K_q]:
+            self._set_zoom(self.zoom * 1.03)
+        if keys[pygame.K_MINUS] or keys[pygame.K_KP_MINUS] or keys[pygame.K_e]:
+            self._set_zoom(self.zoom / 1.03)
+        for event in events:
+            if event.type == pygame.MOUSEWHEEL:
+                self._set_zoom(self.zoom * (1.15 ** event.y))
+
+        self._clamp_center()
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+
+    def _tile_to_screen(self, tile_x, tile_y):
+        """Convert tile coordinates to screen coordinates for the current view."""
+        sx = self.viewport.centerx + (tile_x - self.center[0]) * self.zoom
+        sy = self.viewport.centery + (tile_y - self.center[1]) * self.zoom
+        return int(sx), int(sy)
+
+    def _render_view(self):
+        """Scale the visible part of the best pyramid level (cached)."""
+        tiles_per_pixel = 1 / self.zoom
+        level_index = 0
+        if tiles_per_pixel > 1:
+            level_index = min(len(self._levels) - 1, int(math.log2(tiles_per_pixel)))
+        factor = 2 ** level_index
+        surface = self._level_surfaces[level_index]
+
+        # Visible tiles, then the level pixels covering them
+        half_w = self.viewport.width / 2 / self.zoom
+        half_h = self.viewport.height / 2 / self.zoom
+        lx0 = max(0, int((self.center[0] - half_w) // factor))
+        ly0 = max(0, int((self.center[1] - half_h) // factor))
+        lx1 = min(surface.get_width(), int(math.ceil((self.center[0] + half_w) / factor)))
+        ly1 = min(surface.get_height(), int(math.ceil((self.center[1] + half_h) / factor)))
+        if lx0 >= lx1 or ly0 >= ly1:
+            self._view_surface = None
+            return
+
+        pos = self._tile_to_screen(lx0 * factor, ly0 * factor)
+        end = self._tile_to_screen(lx1 * factor, ly1 * factor)
+        key = (self._version, level_index, lx0, ly0, lx1, ly1, end[0] - pos[0], end[1] - pos[1])
+        if key != self._view_cache_key:
+            source = surface.subsurface((lx0, ly0, lx1 - lx0, ly1 - ly0))
+            self._view_surface = pygame.transform.scale(source, (end[0] - pos[0], end[1] - pos[1]))
+            self._view_cache_key = key
+        self._view_pos = pos
+
+    def draw(self, screen, player_tile_x, player_tile_y, cabin=None, cat_positions=None):
+        """Draw the world map over the game."""
+        if not self.is_showing:
+            return
+
+        screen.fill((15, 15, 20))
+
+        # Terrain
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.viewport)
+        self._render_view()
+        if self._view_surface is not None:
+            screen.blit(self._view_surface, self._view_pos)
+
+        # Markers (minimum size so they stay visible when zoomed out)
+        marker_size = max(3, int(self.zoom))
+
+        if cabin is not None:
+            visited = self.minimap.visited[
+                max(0, cabin.y):max(0, cabin.y + cabin.height),
+                max(0, cabin.x):max(0, cabin.x + cabin.width)
+            ]
+            if visited.any():
+                cx, cy = self._tile_to_screen(cabin.x, cabin.y)
+                width = max(4, int(cabin.width * self.zoom))
+                height = max(4, int(cabin.height * self.zoom))
+                pygame.draw.rect(screen, self.color_cabin, (cx, cy, width, height))
+
+        if cat_positions:
+            for (tx, ty, _) in cat_positions:
+                if self.minimap.is_visited(tx, ty):
+                    pygame.draw.circle(screen, self.color_cat, self._tile_to_screen(tx + 0.5, ty + 0.5), marker_size)
+
+        pulse = (pygame.time.get_ticks() % 1000) / 1000
+        player_pos = self._tile_to_screen(player_tile_x + 0.5, player_tile_y + 0.5)
+        pygame.draw.circle(screen, self.color_player, player_pos, marker_size + 1 + int(pulse * 3))
+
+        screen.set_clip(previous_clip)
+        pygame.draw.rect(screen, self.color_border, self.viewport, 2)
+
+        # Title and hints
+        title = self.title_font.render("WORLD MAP", True, (200, 180, 140))
+        screen.blit(title, title.get_rect(centerx=self.screen_width // 2, centery=self.viewport.top - 22))
+
+        explored = f"Explored: {self.minimap.get_exploration_percent():.1f}%"
+        explored_surface = self.hint_font.render(explored, True, (150, 140, 130))
+        screen.blit(explored_surface, (self.viewport.left, self.viewport.bottom + 12))
+
+        hint = self.hint_font.render("[WASD] Pan  [Q/E] Zoom  [M] Close", True, (200, 180, 100))
+        screen.blit(hint, hint.get_rect(right=self.viewport.right, top=self.viewport.bottom + 12))
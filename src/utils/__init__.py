@@ -1,7 +1,12 @@
 from src.utils.resource_path import resource_path
+from src.utils.lazy_data import LazyList
+from src.utils.asset_archive import get_bytes, open_asset, list_assets
 from src.utils.asset_cache import (
-    get_image, get_font, preload_all_assets,
+    get_image, get_derived, get_scaled, get_font, get_font_report, preload_all_assets, AssetPreloader,
+    get_animation, get_animation_frame, get_atlas,
+    pin_image, unpin_image, set_cache_budget, get_cache_stats,
     get_cached_trees, set_cached_trees,
     get_cached_enemy_spawns, set_cached_enemy_spawns,
-    clear_all_caches
+    reconvert_images, clear_image_cache, clear_all_caches
 )
+from src.utils.alloc_tracker import AllocationTracker
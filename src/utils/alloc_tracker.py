@@ -0,0 +1,204 @@
+"""
+Debug instrumentation: per-frame surface allocations and asset cache use.
+
+While enabled, pygame.Surface, pygame.font.Font and the pygame.transform /
+pygame.image functions that return new surfaces are replaced by tracking
+versions, so every new surface is counted with its pixel bytes and the
+file:line that created it. Surfaces made by methods of existing surfaces
+(convert, copy, subsurface) are not counted. Each frame is written as one
+line to a JSONL log and the last frame is shown as an overlay (F3 toggles it).
+
+Only for debugging (python main.py --alloc-debug): the wrappers slow down
+every allocation.
+"""
+import functools
+import json
+import os
+import sys
+
+import pygame
+from src.utils.asset_cache import get_font, get_cache_stats
+
+_TRANSFORM_FUNCTIONS = ('scale', 'smoothscale', 'scale_by', 'smoothscale_by', 'scale2x',
+                        'flip', 'rotate', 'rotozoom', 'chop', 'laplacian')
+_IMAGE_FUNCTIONS = ('load', 'frombuffer', 'fromstring', 'frombytes')
+
+_Surface = pygame.Surface  # The real class (pygame.Surface is replaced while tracking)
+_tracker = None  # The enabled AllocationTracker
+
+
+class _TrackedSurface(_Surface):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if _tracker is not None:
+            _tracker._record(self)
+
+
+class _TrackedFont(pygame.font.Font):
+    def render(self, *args, **kwargs):
+        surface = super().render(*args, **kwargs)
+        if _tracker is not None:
+            _tracker._record(surface)
+        return surface
+
+
+def _track_result(function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        surface = function(*args, **kwargs)
+        if _tracker is not None:
+            _tracker._record(surface)
+        return surface
+    return wrapper
+
+
+class AllocationTracker:
+    """Counts surface allocations per frame and logs them as JSONL."""
+
+    def __init__(self, log_path, top_sites=5):
+        """
+        Args:
+            log_path: JSONL file to write one record per frame to
+            top_sites: Number of call sites shown in the overlay
+        """
+        self.log_path = log_path
+        self.top_sites = top_sites
+        self.show_overlay = True
+        self.frame = 0
+        self.last = None  # Record of the last finished frame
+
+        self._log = None
+        self._originals = []  # (module, name, original) restored by disable()
+        self._paused = False
+        self._count = 0
+        self._bytes = 0
+        self._sites = {}  # 'file:line' -> [count, bytes]
+        self._site_names = {}  # code filename -> short path
+        self._cache_stats = None
+        self._font = None
+        self._panel = None
+
+    def enable(self):
+        """Install the tracking wrappers and open the log."""
+        global _tracker
+        if _tracker is not None:
+            return
+        self._patch(pygame, 'Surface', _TrackedSurface)
+        self._patch(pygame.font, 'Font', _TrackedFont)
+        for name in _TRANSFORM_FUNCTIONS:
+            if hasattr(pygame.transform, name):
+                self._patch(pygame.transform, name, _track_result(getattr(pygame.transform, name)))
+        for name in _IMAGE_FUNCTIONS:
+            if hasattr(pygame.image, name):
+                self._patch(pygame.image, name, _track_result(getattr(pygame.image, name)))
+
+        try:
+            self._log = open(self.log_path, 'w', encoding='utf-8')
+        except OSError as e:
+            print(f"Warning: Could not open allocation log: {e}")
+        self._cache_stats = get_cache_stats()
+        _tracker = self
+
+    def disable(self):
+        """Restore the original pygame functions and close the log."""
+        global _tracker
+        if _tracker is not self:
+            return
+        _tracker = None
+        for module, name, original in reversed(self._originals):
+            setattr(module, name, original)
+        self._originals = []
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _patch(self, module, name, replacement):
+        self._originals.append((module, name, getattr(module, name)))
+        setattr(module, name, replacement)
+
+    def _record(self, surface):
+        """Count a new surface; the call site is the wrappers' caller."""
+        if self._paused or not isinstance(surface, _Surface):
+            return
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        code = sys._getframe(2)
+        filename = code.f_code.co_filename
+        short = self._site_names.get(filename)
+        if short is None:
+            short = self._site_names[filename] = os.path.relpath(filename).replace('\\', '/')
+        site = f"{short}:{code.f_lineno}"
+
+        self._count += 1
+        self._bytes += size
+        counts = self._sites.get(site)
+        if counts is None:
+            self._sites[site] = [1, size]
+        else:
+            counts[0] += 1
+            counts[1] += size
+
+    def next_frame(self, state=None):
+        """
+        Finish the current frame: log its record and start counting the next one.
+
+        Args:
+            state: Optional label for the frame (e.g. the game state)
+
+        Returns:
+            The finished frame's record (dict)
+        """
+        stats = get_cache_stats()
+        previous = self._cache_stats or stats
+        self._cache_stats = stats
+        sites = sorted(self._sites.items(), key=lambda item: item[1][1], reverse=True)
+        self.last = {
+            'frame': self.frame,
+            'state': state,
+            'surfaces': self._count,
+            'bytes': self._bytes,
+            'sites': {site: {'count': count, 'bytes': size} for site, (count, size) in sites},
+            'cache': {key: stats[key] - previous[key] for key in ('hits', 'misses', 'evictions')},
+        }
+        if self._log is not None:
+            self._log.write(json.dumps(self.last) + '\n')
+
+        self.frame += 1
+        self._count = 0
+        self._bytes = 0
+        self._sites = {}
+        return self.last
+
+    def handle_event(self, event):
+        """F3 toggles the overlay."""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.show_overlay = not self.show_overlay
+
+    def draw(self, screen):
+        """Draw the last finished frame's numbers (the overlay itself is not counted)."""
+        if not self.show_overlay or self.last is None:
+            return
+        self._paused = True
+        try:
+            if self._font is None:
+                self._font = get_font(8)
+            last = self.last
+            lines = [
+                f"ALLOC frame {last['frame']}: {last['surfaces']} surfaces, {last['bytes'] / 1024:.1f} KB",
+                f"CACHE {last['cache']['hits']} hits, {last['cache']['misses']} misses, "
+                f"{last['cache']['evictions']} evictions",
+            ]
+            for site, counts in list(last['sites'].items())[:self.top_sites]:
+                lines.append(f"{counts['count']:>4} {counts['bytes'] / 1024:>8.1f} KB  {site}")
+
+            line_height = 12
+            height = len(lines) * line_height + 8
+            width = max(self._font.size(line)[0] for line in lines) + 12
+            if self._panel is None or self._panel.get_width() < width or self._panel.get_height() < height:
+                # Only grows, so the changing text doesn't reallocate it every frame
+                self._panel = _Surface((width + 64, height), pygame.SRCALPHA)
+                self._panel.fill((0, 0, 0, 170))
+            screen.blit(self._panel, (8, 8), (0, 0, width, height))
+            for i, line in enumerate(lines):
+                screen.blit(self._font.render(line, True, (220, 220, 120)), (14, 12 + i * line_height))
+        finally:
+            self._paused = False
@@ -0,0 +1,157 @@
+"""
+Single-file packed asset archive.
+
+assets.pak holds every file under the asset directories plus an index, and
+is memory-mapped on first use, so startup opens one file instead of dozens
+(and a one-file build ships one data file). Without an archive, assets are
+read as loose files through resource_path, so development needs no extra
+step. Build the archive with pack_assets.py.
+
+Format:
+    header struct: magic, format version, JSON index length
+    JSON index: {path: [offset, length, mtime_ns]} with '/' separated paths
+    data: file contents at the given offsets (relative to the data start)
+"""
+import io
+import json
+import mmap
+import os
+import struct
+import threading
+
+from src.utils.atomic_write import write_atomic
+from src.utils.resource_path import resource_path
+
+ARCHIVE_NAME = 'assets.pak'
+ARCHIVE_MAGIC = b'MOSA'
+ARCHIVE_VERSION = 1
+ARCHIVE_DIRS = ('graphics', 'fonts', 'audio', 'data')
+_HEADER_STRUCT = struct.Struct('<4sHI')
+
+_index = None  # path -> (offset, length, mtime_ns), None until opened
+_data_start = 0
+_archive_file = None
+_archive_mmap = None
+_open_lock = threading.Lock()  # Assets are also read from decode worker threads
+
+
+def _normalize(path):
+    return path.replace('\\', '/')
+
+
+def _open_archive():
+    """Map the archive and read its index (once per session)."""
+    global _index, _data_start, _archive_file, _archive_mmap
+    if _index is not None:
+        return
+
+    with _open_lock:
+        if _index is not None:
+            return
+        index = {}
+        archive_path = resource_path(ARCHIVE_NAME)
+        if os.path.exists(archive_path):
+            try:
+                _archive_file = open(archive_path, 'rb')
+                _archive_mmap = mmap.mmap(_archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, version, index_length = _HEADER_STRUCT.unpack_from(_archive_mmap, 0)
+                if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+                    raise ValueError(f"unsupported asset archive (version {version})")
+                start = _HEADER_STRUCT.size
+                index = {path: tuple(entry) for path, entry in
+                         json.loads(_archive_mmap[start:start + index_length].decode('utf-8')).items()}
+                _data_start = start + index_length
+            except Exception as e:
+                print(f"Warning: Could not open asset archive, using loose files: {e}")
+                index = {}
+        _index = index
+
+
+def get_bytes(path):
+    """
+    Get the contents of an asset.
+
+    Args:
+        path: Relative asset path (e.g. 'graphics/npc/sprytek.png')
+
+    Returns:
+        bytes
+    """
+    _open_archive()
+    entry = _index.get(_normalize(path))
+    if entry is not None:
+        offset, length, _ = entry
+        start = _data_start + offset
+        return _archive_mmap[start:start + length]
+
+    with open(resource_path(path), 'rb') as f:
+        return f.read()
+
+
+def open_asset(path):
+    """Open an asset as a binary file object (in-memory if it is in the archive)."""
+    _open_archive()
+    if _normalize(path) in _index:
+        return io.BytesIO(get_bytes(path))
+    return open(resource_path(path), 'rb')
+
+
+def asset_stat(path):
+    """
+    Get (mtime_ns, size) of an asset's source file.
+
+    Raises:
+        OSError: if the asset doesn't exist
+    """
+    _open_archive()
+    entry = _index.get(_normalize(path))
+    if entry is not None:
+        _, length, mtime_ns = entry
+        return mtime_ns, length
+    stat = os.stat(resource_path(path))
+    return stat.st_mtime_ns, stat.st_size
+
+
+def list_assets(directory):
+    """Sorted paths of the assets directly inside a directory."""
+    _open_archive()
+    prefix = _normalize(directory).rstrip('/') + '/'
+    paths = {path for path in _index if path.startswith(prefix) and '/' not in path[len(prefix):]}
+
+    full_dir = resource_path(directory)
+    if os.path.isdir(full_dir):
+        paths.update(prefix + name for name in os.listdir(full_dir)
+                     if os.path.isfile(os.path.join(full_dir, name)))
+    return sorted(paths)
+
+
+def build_archive(root='.', output=None):
+    """
+    Pack every file under ARCHIVE_DIRS into an archive.
+
+    Args:
+        root: Directory containing the asset directories
+        output: Archive path (default: ARCHIVE_NAME inside root)
+
+    Returns:
+        Number of files packed
+    """
+    index = {}
+    blobs = []
+    offset = 0
+    for directory in ARCHIVE_DIRS:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, directory)):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                full_path = os.path.join(dirpath, filename)
+                path = _normalize(os.path.relpath(full_path, root))
+                with open(full_path, 'rb') as f:
+                    data = f.read()
+                index[path] = [offset, len(data), os.stat(full_path).st_mtime_ns]
+                blobs.append(data)
+                offset += len(data)
+
+    index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    header = _HEADER_STRUCT.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, len(index_bytes))
+    write_atomic(output or os.path.join(root, ARCHIVE_NAME), b''.join([header, index_bytes, *blobs]))
+    return len(index)
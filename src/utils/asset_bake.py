@@ -0,0 +1,245 @@
+"""
+On-disk bake of pre-scaled images.
+
+Every (path, size) variant loaded at startup is stored as raw RGBA pixels in
+one blob file, described by a JSON manifest. Later startups memory-map the
+blob and wrap each variant with pygame.image.frombuffer, so no PNG decoding
+or scaling is needed. An entry is stale when its source file changed: the
+mtime and size are checked first, the content hash only when they differ.
+
+Cached images keep views of the mapped blob, so it can't be replaced while
+the game runs (Windows refuses to replace a mapped file). Every bake is
+written to a new numbered blob that the manifest points to; older blobs
+are removed once they are no longer mapped.
+
+The preloader bakes missing variants on first run; bake_assets.py bakes
+everything up front.
+"""
+import hashlib
+import io
+import json
+import mmap
+import os
+
+import pygame
+from src.utils.asset_archive import get_bytes, asset_stat
+from src.utils.atomic_write import write_atomic
+
+BAKE_VERSION = 2
+BLOB_PREFIX = 'baked_'  # Blobs are baked_<serial>.bin
+MANIFEST_NAME = 'baked.json'
+
+_manifest = None  # key -> entry, None until load_bake()
+_blob_serial = 0  # Serial of the blob the manifest points to
+_blob_file = None
+_blob_mmap = None
+_pending = {}  # key -> (entry, rgba bytes) baked this session, not yet written
+
+
+def get_bake_dir():
+    """Get the bake directory (next to saves and settings), creating it if necessary."""
+    from src.save_system import get_save_dir
+
+    bake_dir = get_save_dir().parent / 'bake'
+    bake_dir.mkdir(parents=True, exist_ok=True)
+    return bake_dir
+
+
+def _key(path, size):
+    return f"{path}|{size[0]}x{size[1]}" if size else path
+
+
+def _hash_bytes(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def _blob_name(serial):
+    return f"{BLOB_PREFIX}{serial}.bin"
+
+
+def _remove_old_blobs(bake_dir, keep_serial):
+    """Delete blobs other than the current one (those still mapped stay until next time)."""
+    keep = _blob_name(keep_serial)
+    for name in os.listdir(bake_dir):
+        if name.endswith('.bin') and name != keep and (name.startswith(BLOB_PREFIX) or name == 'baked.bin'):
+            try:
+                os.unlink(bake_dir / name)
+            except OSError:
+                pass
+
+
+def load_bake():
+    """Open the manifest and memory-map the blob (once per session)."""
+    global _manifest, _blob_serial, _blob_file, _blob_mmap
+    if _manifest is not None:
+        return
+
+    _manifest = {}
+    try:
+        bake_dir = get_bake_dir()
+        with open(bake_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != BAKE_VERSION:
+            return
+        _blob_serial = manifest['blob_serial']
+        _blob_file = open(bake_dir / _blob_name(_blob_serial), 'rb')
+        if os.fstat(_blob_file.fileno()).st_size > 0:
+            _blob_mmap = mmap.mmap(_blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+        _manifest = manifest['entries']
+        _remove_old_blobs(bake_dir, _blob_serial)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Could not load asset bake: {e}")
+        _manifest = {}
+
+
+def close_bake():
+    """Release the memory-mapped blob (unmapped once no baked surface uses it)."""
+    global _manifest, _blob_file, _blob_mmap
+    if _blob_mmap is not None:
+        try:
+            _blob_mmap.close()
+        except BufferError:
+            pass  # Baked surfaces still use it; unmapped once they are gone
+    if _blob_file is not None:
+        _blob_file.close()
+    _manifest = None
+    _blob_file = None
+    _blob_mmap = None
+
+
+def _is_fresh(path, entry):
+    """Check an entry against its source file (mtime/size, then content hash)."""
+    try:
+        mtime_ns, file_size = asset_stat(path)
+    except OSError:
+        return False
+    if (mtime_ns, file_size) == (entry['mtime_ns'], entry['file_size']):
+        return True
+    if _hash_bytes(get_bytes(path)) != entry['hash']:
+        return False
+    # Touched but unchanged: remember the new mtime with the next write
+    entry['mtime_ns'], entry['file_size'] = mtime_ns, file_size
+    return True
+
+
+def get_baked(path, size=None):
+    """
+    Get a baked variant as an unconverted surface.
+
+    The surface shares memory with the mapped blob, so convert it (or copy
+    it) before keeping it.
+
+    Returns:
+        pygame.Surface, or None if not baked or stale
+    """
+    load_bake()
+    key = _key(path, size)
+    if key in _pending:
+        entry, rgba = _pending[key]
+        return pygame.image.frombuffer(rgba, (entry['width'], entry['height']), 'RGBA')
+
+    entry = _manifest.get(key)
+    if entry is None or _blob_mmap is None or not _is_fresh(path, entry):
+        return None
+    start = entry['offset']
+    view = memoryview(_blob_mmap)[start:start + entry['length']]
+    return pygame.image.frombuffer(view, (entry['width'], entry['height']), 'RGBA')
+
+
+def decode_for_bake(path, size=None):
+    """
+    Decode and scale an image and pack its pixels for the bake.
+
+    Safe to call from worker threads.
+
+    Returns:
+        (surface, entry, rgba bytes)
+    """
+    data = get_bytes(path)
+    mtime_ns, file_size = asset_stat(path)
+
+    img = pygame.image.load(io.BytesIO(data), os.path.basename(path))
+    if size:
+        img = pygame.transform.scale(img, size)
+    rgba = pygame.image.tobytes(img, 'RGBA')
+
+    entry = {
+        'width': img.get_width(),
+        'height': img.get_height(),
+        'length': len(rgba),
+        'mtime_ns': mtime_ns,
+        'file_size': file_size,
+        'hash': _hash_bytes(data),
+    }
+    return img, entry, rgba
+
+
+def add_baked(path, size, entry, rgba):
+    """Queue a variant for the next save_bake()."""
+    _pending[_key(path, size)] = (entry, rgba)
+
+
+def has_pending():
+    """Whether save_bake() has anything new to write."""
+    return bool(_pending)
+
+
+def save_bake():
+    """Write the fresh existing entries plus the pending ones as a new bake."""
+    load_bake()
+    entries = {}
+    blobs = []
+    offset = 0
+
+    def add(key, entry, rgba):
+        nonlocal offset
+        entries[key] = dict(entry, offset=offset, length=len(rgba))
+        blobs.append(rgba)
+        offset += len(rgba)
+
+    try:
+        # Keep existing entries (copied out of the current blob)
+        if _blob_mmap is not None:
+            for key, entry in _manifest.items():
+                if key not in _pending:
+                    start = entry['offset']
+                    add(key, entry, _blob_mmap[start:start + entry['length']])
+        for key, (entry, rgba) in _pending.items():
+            add(key, entry, rgba)
+
+        # New blob next to the mapped one, then switch the manifest over
+        bake_dir = get_bake_dir()
+        serial = _blob_serial + 1
+        write_atomic(bake_dir / _blob_name(serial), b''.join(blobs))
+        manifest = {'version': BAKE_VERSION, 'blob_serial': serial, 'entries': entries}
+        write_atomic(bake_dir / MANIFEST_NAME, json.dumps(manifest).encode('utf-8'))
+        _pending.clear()
+
+        close_bake()
+        _remove_old_blobs(bake_dir, serial)
+        return True
+    except Exception as e:
+        print(f"Warning: Could not write asset bake: {e}")
+        return False
+
+
+def bake_assets():
+    """Build-once step: bake every startup image variant that is missing or stale."""
+    from src.utils.asset_cache import _preload_manifest
+
+    images, _ = _preload_manifest()
+    baked = 0
+    for path, size, _ in images:
+        if get_baked(path, size) is not None:
+            continue
+        try:
+            _, entry, rgba = decode_for_bake(path, size)
+            add_baked(path, size, entry, rgba)
+            baked += 1
+        except Exception as e:
+            print(f"Warning: Could not bake image {path}: {e}")
+    if has_pending():
+        save_bake()
+    return baked
@@ -2,17 +2,53 @@
 Global asset cache to prevent reloading resources on respawn.
 Assets are loaded once and cached for the entire game session.
 """
+from collections import OrderedDict
+
+import hashlib
+import io
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import pygame
-from src.utils.resource_path import resource_path
+from src.utils.asset_bake import get_baked, decode_for_bake, add_baked, has_pending, save_bake
+from src.utils.asset_archive import get_bytes
+from src.utils.sprite_atlas import SpriteAtlas
 
 # Global cache storage
-_image_cache = {}
+_image_cache = OrderedDict()  # LRU order: least recently used first
 _font_cache = {}
+_font_data = None  # TTF bytes, read once and shared by every font size
+_font_usage = {}  # size -> {'first_use': seconds since start, 'lookups': count}
+_start_time = time.perf_counter()
+_animation_cache = {}  # Animation frames with pre-flipped variants
+_atlas_cache = {}  # Sprite atlases by name
 _map_cache = {}
 _tree_cache = {}  # Cache for generated tree positions
 _enemy_spawn_cache = {}  # Cache for enemy spawn positions
 _initialized = False
 
+# Memory accounting for images (surface bytes = w * h * bytes per pixel).
+# Cached images, their kept decoded sources and mirrored animation frames
+# all count against the budget. Unpinned images (with their sources) are
+# evicted least recently used first once it is exceeded; pinned ones
+# (always-visible assets) are never evicted, but their sources are dropped
+# if still over budget.
+DEFAULT_CACHE_BUDGET = 64 * 1024 * 1024
+_cache_budget = DEFAULT_CACHE_BUDGET
+_image_bytes = {}  # cache_key -> bytes
+_image_bytes_total = 0
+_animation_bytes = 0  # Mirrored frames (the originals are in the image cache)
+_font_bytes = 0  # Size of the shared font file buffer
+_pinned = set()
+
+# Unconverted source pixels per image (decoded, or a view of the bake) so a
+# display change only re-runs convert/convert_alpha, without disk I/O
+_image_sources = {}  # cache_key -> (surface, convert_alpha, baked)
+_source_bytes = 0  # Decoded sources only; baked ones are memory-mapped
+_animation_keys = {}  # name -> image cache keys of its frames
+_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
 
 def _ensure_initialized():
     """Ensure pygame is initialized for asset loading."""
@@ -22,6 +58,116 @@ def _ensure_initialized():
         _initialized = True
 
 
+def _surface_bytes(surface):
+    """Memory held by a surface's pixels."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def _store_image(cache_key, img, source=None, convert_alpha=True, baked=False):
+    """Add an image (and its unconverted source) to the cache, account for it and enforce the budget."""
+    global _image_bytes_total, _source_bytes
+    _image_cache[cache_key] = img
+    _image_bytes[cache_key] = _surface_bytes(img)
+    _image_bytes_total += _image_bytes[cache_key]
+    if source is not None:
+        _image_sources[cache_key] = (source, convert_alpha, baked)
+        if not baked:
+            _source_bytes += _surface_bytes(source)
+    _evict_to_budget()
+
+
+def _drop_source(cache_key):
+    """Forget the source pixels of an evicted image."""
+    global _source_bytes
+    source, _, baked = _image_sources.pop(cache_key, (None, None, True))
+    if not baked:
+        _source_bytes -= _surface_bytes(source)
+
+
+def _total_bytes():
+    """Bytes counted against the cache budget."""
+    return _image_bytes_total + _source_bytes + _animation_bytes
+
+
+def _evict_to_budget():
+    """Evict least recently used unpinned images, then sources, until within budget."""
+    global _image_bytes_total
+    if _total_bytes() <= _cache_budget:
+        return
+    for cache_key in list(_image_cache):
+        if _total_bytes() <= _cache_budget:
+            return
+        if cache_key in _pinned:
+            continue
+        del _image_cache[cache_key]
+        _image_bytes_total -= _image_bytes.pop(cache_key)
+        _drop_source(cache_key)
+        _cache_stats['evictions'] += 1
+
+    # Only pinned images left: re-conversion falls back to the image itself
+    for cache_key, (_, _, baked) in list(_image_sources.items()):
+        if _total_bytes() <= _cache_budget:
+            return
+        if not baked:
+            _drop_source(cache_key)
+
+
+def set_cache_budget(budget_bytes):
+    """Set the image cache memory budget in bytes, evicting if needed."""
+    global _cache_budget
+    _cache_budget = budget_bytes
+    _evict_to_budget()
+
+
+def pin_image(path, size=None):
+    """Never evict this image (loaded now if needed)."""
+    _pinned.add((path, size))
+    return get_image(path, size)
+
+
+def unpin_image(path, size=None):
+    """Allow this image to be evicted again."""
+    _pinned.discard((path, size))
+    _evict_to_budget()
+
+
+def get_cache_stats():
+    """
+    Get cache statistics for logging.
+
+    Returns:
+        Dictionary with hits, misses, evictions, budget and bytes per category
+    """
+    return {
+        'hits': _cache_stats['hits'],
+        'misses': _cache_stats['misses'],
+        'evictions': _cache_stats['evictions'],
+        'budget': _cache_budget,
+        'images': len(_image_cache),
+        'pinned': len(_pinned),
+        'bytes': {
+            'images': _image_bytes_total,
+            'pinned_images': sum(_image_bytes[key] for key in _pinned if key in _image_bytes),
+            'animations': _animation_bytes,
+            'fonts': _font_bytes,
+            'sources': _source_bytes,
+            'total': _total_bytes(),
+        },
+    }
+
+
+def _decode_image(path, size=None):
+    """
+    Decode (and scale) an image without converting it for the display.
+
+    Safe to call from worker threads: it doesn't touch the display surface.
+    """
+    img = pygame.image.load(io.BytesIO(get_bytes(path)), os.path.basename(path))
+    if size:
+        img = pygame.transform.scale(img, size)
+    return img
+
+
 def get_image(path, size=None, convert_alpha=True):
     """
     Load and cache an image. Returns cached version if already loaded.
@@ -38,50 +184,180 @@ def get_image(path, size=None, convert_alpha=True):
     cache_key = (path, size)
 
     if cache_key in _image_cache:
+        _cache_stats['hits'] += 1
+        _image_cache.move_to_end(cache_key)
         return _image_cache[cache_key]
+    _cache_stats['misses'] += 1
 
-    # Load image
+    # Load image (pre-scaled from the bake if possible)
     try:
-        img = pygame.image.load(resource_path(path))
-        if convert_alpha:
-            img = img.convert_alpha()
-        else:
-            img = img.convert()
+        source = get_baked(path, size)
+        baked = source is not None
+        if not baked:
+            source = _decode_image(path, size)
+        img = source.convert_alpha() if convert_alpha else source.convert()
 
-        if size:
-            img = pygame.transform.scale(img, size)
-
-        _image_cache[cache_key] = img
+        _store_image(cache_key, img, source, convert_alpha, baked)
         return img
     except Exception as e:
         print(f"Warning: Could not load image {path}: {e}")
         return None
 
 
+def get_derived(key, build, convert_alpha=True):
+    """
+    Get a generated surface (placeholder, rescaled or tinted copy) from the cache.
+
+    Derived surfaces share the image cache, its budget and display
+    re-conversion; build is only called on a miss.
+
+    Args:
+        key: Hashable content key describing everything the surface depends on
+        build: Function returning the unconverted pygame.Surface
+        convert_alpha: Whether to convert with alpha channel
+
+    Returns:
+        pygame.Surface
+    """
+    cache_key = ('derived', key)
+
+    if cache_key in _image_cache:
+        _cache_stats['hits'] += 1
+        _image_cache.move_to_end(cache_key)
+        return _image_cache[cache_key]
+    _cache_stats['misses'] += 1
+
+    source = build()
+    img = source.convert_alpha() if convert_alpha else source.convert()
+    _store_image(cache_key, img, source, convert_alpha)
+    return img
+
+
+def get_scaled(image, size):
+    """
+    Get a cached rescaled copy of a surface.
+
+    The key is a hash of the surface pixels, so equal images share one
+    scaled variant no matter where they came from.
+
+    Args:
+        image: pygame.Surface to scale
+        size: (width, height) tuple
+
+    Returns:
+        pygame.Surface
+    """
+    size = tuple(size)
+    if image.get_size() == size:
+        return image
+    content = hashlib.sha1(image.get_view('1')).hexdigest()
+    key = ('scaled', content, image.get_size(), image.get_bitsize(), size)
+    return get_derived(key, lambda: pygame.transform.scale(image, size),
+                       convert_alpha=bool(image.get_flags() & pygame.SRCALPHA))
+
+
 def get_font(size):
     """
     Load and cache the game font at specified size.
 
+    Fonts are created on first use. The TTF file is read once; every size
+    reads it from the same in-memory buffer.
+
     Args:
         size: Font size in pixels
 
     Returns:
         pygame.font.Font
     """
+    global _font_data, _font_bytes
     _ensure_initialized()
 
     if size in _font_cache:
+        _cache_stats['hits'] += 1
+        _font_usage[size]['lookups'] += 1
         return _font_cache[size]
+    _cache_stats['misses'] += 1
 
-    font = pygame.font.Font(resource_path('fonts/PressStart2P.ttf'), size)
+    if _font_data is None:
+        _font_data = get_bytes('fonts/PressStart2P.ttf')
+        _font_bytes = len(_font_data)
+
+    # BytesIO shares the bytes object until written to, so no copy per size
+    font = pygame.font.Font(io.BytesIO(_font_data), size)
     _font_cache[size] = font
+    _font_usage[size] = {'first_use': time.perf_counter() - _start_time, 'lookups': 1}
     return font
 
 
-def preload_all_assets():
+def get_font_report():
     """
-    Preload all game assets at startup for faster loading.
-    Call this once at game initialization.
+    Report which font sizes were actually used, in order of first use.
+
+    Returns:
+        List of (size, first use in seconds since start, lookup count)
+    """
+    usage = sorted(_font_usage.items(), key=lambda item: item[1]['first_use'])
+    return [(size, info['first_use'], info['lookups']) for size, info in usage]
+
+
+def get_animation(name, paths, size=None):
+    """
+    Load and cache animation frames together with their mirrored variants.
+
+    Flipping is done once here, so drawing a left/right facing sprite is a
+    plain list lookup instead of a new surface every frame. Animation frames
+    are always on screen, so they are pinned in the image cache.
+
+    Args:
+        name: Animation name used as the cache key (e.g. 'enemy')
+        paths: List of relative image paths, one per frame
+        size: Optional (width, height) tuple to scale the frames
+
+    Returns:
+        (frames, flipped_frames) tuple of lists of pygame.Surface
+    """
+    global _animation_bytes
+    if name in _animation_cache:
+        _cache_stats['hits'] += 1
+        return _animation_cache[name]
+    _cache_stats['misses'] += 1
+
+    frames = [pin_image(path, size) for path in paths]
+    _animation_keys[name] = [(path, size) for path in paths]
+    flipped_frames = [
+        pygame.transform.flip(frame, True, False) if frame is not None else None
+        for frame in frames
+    ]
+    _animation_bytes += sum(_surface_bytes(frame) for frame in flipped_frames if frame is not None)
+
+    _animation_cache[name] = (frames, flipped_frames)
+    _evict_to_budget()
+    return _animation_cache[name]
+
+
+def get_animation_frame(name, frame, flipped=False):
+    """
+    Get a single frame of a loaded animation.
+
+    Args:
+        name: Animation name passed to get_animation
+        frame: Frame index
+        flipped: Whether to return the horizontally mirrored variant
+
+    Returns:
+        pygame.Surface
+    """
+    frames, flipped_frames = _animation_cache[name]
+    return flipped_frames[frame] if flipped else frames[frame]
+
+
+def _preload_manifest():
+    """
+    List the assets loaded at startup.
+
+    Returns:
+        (images, animations) where images are (path, size, pinned) and
+        animations are (name, paths, size). Fonts are created on first use.
     """
     from src.ui.lore_data import CATS_LORE, COLLECTIBLES_LORE
     from src.config import TILE_SIZE
@@ -89,47 +365,182 @@ def preload_all_assets():
     TREE_SIZE = 128
     COLLECTIBLE_SIZE = 48
 
-    # Background tiles
-    get_image('graphics/landscape/tile.png', (TILE_SIZE, TILE_SIZE))
-    get_image('graphics/landscape/path.png', (TILE_SIZE, TILE_SIZE))
+    images = []
+
+    # Background tiles (always visible: pinned)
+    images.append(('graphics/landscape/tile.png', (TILE_SIZE, TILE_SIZE), True))
+    images.append(('graphics/landscape/path.png', (TILE_SIZE, TILE_SIZE), True))
 
     # Leaves animation (5 frames)
     for i in range(5):
-        get_image(f'graphics/landscape/leaves/{i}.png', (128, 128))
+        images.append((f'graphics/landscape/leaves/{i}.png', (128, 128), True))
 
     # Trees (2 variants)
     for i in range(1, 3):
-        get_image(f'graphics/landscape/tree{i}.png', (TREE_SIZE, TREE_SIZE))
+        images.append((f'graphics/landscape/tree{i}.png', (TREE_SIZE, TREE_SIZE), True))
 
     # Cat images (for background - 64x64 and inventory - 50x50)
     for cat in CATS_LORE:
         if "image" in cat:
             path = f'graphics/npc/{cat["image"]}'
-            get_image(path, (TREE_SIZE // 2, TREE_SIZE // 2))  # 64x64 for background
-            get_image(path, (50, 50))  # 50x50 for inventory
+            images.append((path, (TREE_SIZE // 2, TREE_SIZE // 2), False))  # 64x64 for background
+            images.append((path, (50, 50), False))  # 50x50 for inventory
 
     # Collectible images (for background - 48x48 and inventory - 40x40)
     for item in COLLECTIBLES_LORE:
         if "image" in item:
             path = f'graphics/landscape/{item["image"]}'
-            get_image(path, (COLLECTIBLE_SIZE, COLLECTIBLE_SIZE))  # 48x48 for background
-            get_image(path, (40, 40))  # 40x40 for inventory
+            images.append((path, (COLLECTIBLE_SIZE, COLLECTIBLE_SIZE), False))  # 48x48 for background
+            images.append((path, (40, 40), False))  # 40x40 for inventory
 
-    # Enemy sprites (4 frames, indexed 1-4)
-    for i in range(1, 5):
-        get_image(f'graphics/npc/enemy/enemy{i}.png', (80, 80))
+    # NPC Sprytek (60x70)
+    images.append(('graphics/npc/sprytek.png', (60, 70), True))
 
-    # Player sprites (70x70)
-    get_image('graphics/character/character_idle.png', (70, 70))
-    get_image('graphics/character/character_walk1.png', (70, 70))
-    get_image('graphics/character/character_walk2.png', (70, 70))
+    animations = [
+        # Enemy sprites (4 frames, indexed 1-4) with mirrored variants
+        ('enemy', [f'graphics/npc/enemy/enemy{i}.png' for i in range(1, 5)], (80, 80)),
+        # Player sprites (70x70) with mirrored variants
+        ('player_idle', ['graphics/character/character_idle.png'], (70, 70)),
+        ('player_walk', [
+            'graphics/character/character_walk1.png',
+            'graphics/character/character_walk2.png',
+        ], (70, 70)),
+    ]
 
-    # NPC Sprytek (60x70)
-    get_image('graphics/npc/sprytek.png', (60, 70))
+    # Animation frames are decoded with the other images
+    for _, paths, size in animations:
+        images.extend((path, size, True) for path in paths)
 
-    # Preload all font sizes used in the game (including menu fonts)
-    for size in [7, 8, 9, 10, 12, 14, 16, 20, 24, 28, 32, 36]:
-        get_font(size)
+    return images, animations
+
+
+class AssetPreloader:
+    """
+    Preloads startup assets without blocking the loading screen.
+
+    Variants found in the on-disk bake (see asset_bake) are used directly.
+    The rest are decoded and scaled on a thread pool (both release the GIL)
+    and added to the bake. convert_alpha needs the display, so images are
+    converted and cached on the main thread by step(), a small batch per call.
+    """
+
+    def __init__(self, max_workers=4, batch_size=8):
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.loaded = 0
+        self.total = 0
+        self.current = ""
+
+        self._executor = None
+        self._pending = []  # (path, size, pinned, baked surface or future) in manifest order
+        self._animations = []
+
+    def start(self):
+        """Build the manifest and submit all image decodes."""
+        images, self._animations = _preload_manifest()
+        self.total = len(images) + len(self._animations)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='asset-decode')
+        for path, size, pinned in images:
+            if pinned:
+                _pinned.add((path, size))
+            if (path, size) in _image_cache:
+                source = None
+            else:
+                source = get_baked(path, size)
+                if source is None:
+                    source = self._executor.submit(decode_for_bake, path, size)
+            self._pending.append((path, size, pinned, source))
+
+    @property
+    def progress(self):
+        """Fraction of assets loaded (0.0 - 1.0)."""
+        return self.loaded / self.total if self.total else 1.0
+
+    @property
+    def is_done(self):
+        return self.total > 0 and self.loaded >= self.total
+
+    def step(self):
+        """
+        Finish up to batch_size assets on the main thread.
+
+        Returns:
+            True once everything is loaded
+        """
+        if self._executor is None:
+            self.start()
+        if self.is_done:
+            return True
+
+        finished = 0
+        while self._pending and finished < self.batch_size:
+            path, size, pinned, source = self._pending[0]
+            baked = True
+            if isinstance(source, Future):
+                if not source.done() and finished > 0:
+                    break  # Don't wait on the main thread if this batch did some work
+                baked = False
+                try:
+                    img, entry, rgba = source.result()
+                    add_baked(path, size, entry, rgba)
+                    source = img
+                except Exception as e:
+                    print(f"Warning: Could not load image {path}: {e}")
+                    source = None
+            if source is not None:
+                _cache_stats['misses'] += 1
+                _store_image((path, size), source.convert_alpha(), source, True, baked)
+            self._pending.pop(0)
+            self.current = path
+            self.loaded += 1
+            finished += 1
+
+        if not self._pending:
+            # Mirrored animation frames are quick: finish them in order
+            while self._animations and finished < self.batch_size:
+                name, paths, size = self._animations.pop(0)
+                get_animation(name, paths, size)
+                self.current = name
+                self.loaded += 1
+                finished += 1
+
+        if self.is_done:
+            self._executor.shutdown(wait=False)
+            # Only after a first run or changed sources
+            if has_pending():
+                save_bake()
+        return self.is_done
+
+
+def get_atlas(name, build_sprites):
+    """
+    Get a sprite atlas by name, packing it on first use.
+
+    Args:
+        name: Atlas name used as the cache key (e.g. 'world')
+        build_sprites: Function returning a dict of key -> pygame.Surface to pack
+
+    Returns:
+        SpriteAtlas
+    """
+    if name in _atlas_cache:
+        _cache_stats['hits'] += 1
+        return _atlas_cache[name]
+    _cache_stats['misses'] += 1
+
+    _atlas_cache[name] = SpriteAtlas(build_sprites())
+    return _atlas_cache[name]
+
+
+def preload_all_assets():
+    """
+    Preload all game assets at startup for faster loading.
+    Blocking version of AssetPreloader; call once at game initialization.
+    """
+    preloader = AssetPreloader()
+    while not preloader.step():
+        pass
 
 
 def get_cached_trees(cache_key):
@@ -156,11 +567,77 @@ def set_cached_enemy_spawns(cache_key, positions):
     _enemy_spawn_cache[cache_key] = positions[:]
 
 
+def reconvert_images():
+    """
+    Re-convert cached images for the current display mode (call after set_mode).
+
+    Images already in the new display format are kept as they are. Others
+    are converted again from their kept source pixels (or from themselves if
+    the source was dropped), without touching the disk; animation frame
+    lists are updated in place so their holders see the new surfaces, and
+    atlases are repacked on next use.
+
+    Returns:
+        Number of images that had to be re-converted
+    """
+    formats = {
+        True: pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha(),
+        False: pygame.Surface((1, 1)).convert(),
+    }
+    global _image_bytes_total, _animation_bytes
+    changed = 0
+    for cache_key, img in list(_image_cache.items()):
+        source, convert_alpha, _ = _image_sources.get(
+            cache_key, (img, bool(img.get_flags() & pygame.SRCALPHA), True))
+        target = formats[convert_alpha]
+        if img.get_bitsize() == target.get_bitsize() and img.get_masks() == target.get_masks():
+            continue
+        img = source.convert_alpha() if convert_alpha else source.convert()
+        _image_cache[cache_key] = img
+        _image_bytes_total += _surface_bytes(img) - _image_bytes[cache_key]
+        _image_bytes[cache_key] = _surface_bytes(img)
+        changed += 1
+
+    if changed:
+        for name, keys in _animation_keys.items():
+            if name not in _animation_cache:
+                continue
+            frames, flipped_frames = _animation_cache[name]
+            for i, cache_key in enumerate(keys):
+                if cache_key in _image_cache:
+                    if flipped_frames[i] is not None:
+                        _animation_bytes -= _surface_bytes(flipped_frames[i])
+                    frames[i] = _image_cache[cache_key]
+                    flipped_frames[i] = pygame.transform.flip(frames[i], True, False)
+                    _animation_bytes += _surface_bytes(flipped_frames[i])
+        _atlas_cache.clear()
+        _evict_to_budget()
+    return changed
+
+
+def clear_image_cache():
+    """Clear cached images and animations (pins are kept for reloading)."""
+    global _image_bytes_total, _animation_bytes, _source_bytes
+    _image_cache.clear()
+    _image_bytes.clear()
+    _image_bytes_total = 0
+    _image_sources.clear()
+    _source_bytes = 0
+    _animation_cache.clear()
+    _animation_keys.clear()
+    _animation_bytes = 0
+    _atlas_cache.clear()
+
+
 def clear_cache():
     """Clear all cached assets. Useful for memory management."""
-    global _image_cache, _font_cache, _map_cache, _tree_cache, _enemy_spawn_cache
-    _image_cache.clear()
+    global _image_cache, _font_cache, _animation_cache, _map_cache, _tree_cache, _enemy_spawn_cache
+    global _font_data, _font_bytes
+    clear_image_cache()
     _font_cache.clear()
+    _font_usage.clear()
+    _font_data = None
+    _font_bytes = 0
     _map_cache.clear()
     _tree_cache.clear()
     _enemy_spawn_cache.clear()
@@ -0,0 +1,31 @@
+"""Crash-safe file writes shared by saves, the asset bake and the asset archive."""
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(path, data: bytes):
+    """Write a file via temp file + fsync + rename, so it is never half-written."""
+    path = Path(path)
+    # Unique temp name: different threads may write the same file
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+    # Persist the rename itself (not supported on Windows)
+    if os.name != 'nt':
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -0,0 +1,33 @@
+"""Data loaded on first use instead of at import time."""
+from collections.abc import Sequence
+
+
+class LazyList(Sequence):
+    """
+    Read-only list whose contents come from a loader called on first access.
+
+    Lets modules keep `DATA = ...` constants (and `from x import DATA`)
+    without reading files while the game is starting up.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._items = None
+
+    def _load(self):
+        if self._items is None:
+            self._items = list(self._loader())
+        return self._items
+
+    def __getitem__(self, index):
+        return self._load()[index]
+
+    def __len__(self):
+        return len(self._load())
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __repr__(self):
+        state = 'not loaded' if self._items is None else f'{len(self._items)} items'
+        return f"<LazyList {state}>"
@@ -0,0 +1,81 @@
+"""
+Sprite atlas: packs many small sprites into a few large sheets.
+
+Drawing from one sheet with area rects lets a whole layer go to the screen
+in a single Surface.blits call instead of one blit per sprite surface.
+"""
+from typing import NamedTuple
+
+import pygame
+
+
+class AtlasSprite(NamedTuple):
+    """Handle to a packed sprite: the sheet it lives on and its area there."""
+    sheet: pygame.Surface
+    area: pygame.Rect
+
+
+class SpriteAtlas:
+    """
+    Shelf-packed sprite sheets.
+
+    Sprites are sorted by height and laid out left to right in rows
+    ("shelves") of a fixed width; a new sheet is started once a sheet would
+    grow past max_height. Each sheet is only as tall as its shelves.
+    """
+
+    def __init__(self, sprites, sheet_width=1024, max_height=2048, padding=1):
+        """
+        Args:
+            sprites: dict of key -> pygame.Surface (None values are skipped)
+            sheet_width: Width of every sheet
+            max_height: Maximum sheet height before starting a new sheet
+            padding: Empty pixels between sprites (avoids bleeding)
+        """
+        self.sheets = []
+        self._sprites = {}
+        self._pack(sprites, sheet_width, max_height, padding)
+
+    def _pack(self, sprites, sheet_width, max_height, padding):
+        items = [(key, surface) for key, surface in sprites.items() if surface is not None]
+        items.sort(key=lambda item: item[1].get_height(), reverse=True)
+
+        # Lay out: list of sheets, each a list of (key, surface, x, y) plus its height
+        layouts = []
+        placements = []
+        x = y = shelf_height = 0
+        for key, surface in items:
+            width, height = surface.get_size()
+            if x + width > sheet_width:
+                # Next shelf
+                x, y = 0, y + shelf_height + padding
+                shelf_height = 0
+            if y + height > max_height and placements:
+                # Next sheet
+                layouts.append((placements, y + shelf_height))
+                placements = []
+                x = y = shelf_height = 0
+            placements.append((key, surface, x, y))
+            x += width + padding
+            shelf_height = max(shelf_height, height)
+        if placements:
+            layouts.append((placements, y + shelf_height))
+
+        for placements, height in layouts:
+            sheet = pygame.Surface((sheet_width, max(1, height)), pygame.SRCALPHA).convert_alpha()
+            sheet.fill((0, 0, 0, 0))
+            for key, surface, x, y in placements:
+                # Exact copy of the pixels, alpha included (no blending)
+                sheet.blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+                self._sprites[key] = AtlasSprite(sheet, pygame.Rect(x, y, *surface.get_size()))
+            self.sheets.append(sheet)
+
+    def get(self, key):
+        """Get the AtlasSprite for a key, or None if it isn't packed."""
+        return self._sprites.get(key)
+
+    def __contains__(self, key):
+        return key in self._sprites
+
+    def __len__(self):
+        return len(self._sprites)
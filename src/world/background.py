@@ -3,7 +3,7 @@ import random
 import math
 from src.ui.lore_display import create_placeholder
 from src.ui.lore_data import CATS_LORE, COLLECTIBLES_LORE
-from src.utils import get_image, get_cached_trees, set_cached_trees
+from src.utils import get_image, get_animation, get_atlas, get_cached_trees, set_cached_trees
 from src.config import TILE_SIZE
 
 # Constants
@@ -137,6 +137,7 @@ class LeafParticle:
 class Background:
     def __init__(self, map_width, map_height, tile_size, screen_width, screen_height, cat_positions=None, collectible_positions=None, spawn_point=None, grid=None):
         self.tile_image, self.tree_images, self.path_image, self.cat_images, self.collectible_images = load_graphics()
+        self._setup_atlas()
         self.map_width = map_width
         self.map_height = map_height
         self.tile_size = tile_size
@@ -172,6 +173,39 @@ class Background:
         self.cat_positions = self._setup_cats(cat_positions) if cat_positions else self._generate_cats()
         self.collectible_positions = self._setup_collectibles(collectible_positions) if collectible_positions else self._generate_collectibles()
 
+    def refresh_graphics(self):
+        """Pick up re-converted images after a display change (all cache hits)."""
+        self.tile_image, self.tree_images, self.path_image, self.cat_images, self.collectible_images = load_graphics()
+        self._setup_atlas()
+
+    def _setup_atlas(self):
+        """Pack world sprites into the shared atlas and keep (sheet, area) pairs for blits."""
+        def build_sprites():
+            sprites = {('tile',): self.tile_image, ('path',): self.path_image}
+            sprites.update({('tree', i): img for i, img in enumerate(self.tree_images)})
+            sprites.update({('cat', i): img for i, img in enumerate(self.cat_images)})
+            sprites.update({('collectible', i): img for i, img in enumerate(self.collectible_images)})
+            frames, flipped_frames = get_animation('enemy', [f'graphics/npc/enemy/enemy{i}.png' for i in range(1, 5)],
+                                                   (80, 80))
+            sprites.update({('enemy', i, False): img for i, img in enumerate(frames)})
+            sprites.update({('enemy', i, True): img for i, img in enumerate(flipped_frames)})
+            return sprites
+
+        self.atlas = get_atlas('world', build_sprites)
+        self._tile_sprite = self._atlas_source(('tile',), self.tile_image)
+        self._path_sprite = self._atlas_source(('path',), self.path_image)
+        self._tree_sprites = [self._atlas_source(('tree', i), img) for i, img in enumerate(self.tree_images)]
+        self._cat_sprites = [self._atlas_source(('cat', i), img) for i, img in enumerate(self.cat_images)]
+        self._collectible_sprites = [self._atlas_source(('collectible', i), img)
+                                     for i, img in enumerate(self.collectible_images)]
+
+    def _atlas_source(self, key, surface):
+        """(source, area) for blits: the atlas sheet if packed, else the surface itself."""
+        sprite = self.atlas.get(key)
+        if sprite is None:
+            return surface, None
+        return sprite.sheet, sprite.area
+
     def _convert_grid(self, grid):
         """Convert grid (0/1 strings) to map_data format (path/grass)."""
         if grid is None:
@@ -401,14 +435,19 @@ class Background:
         end_y = min(len(self.map_data),
                     (camera_offset[1] + self.screen_height) // self.tile_size + 2)
 
+        tile_sheet, tile_area = self._tile_sprite
+        path_sheet, path_area = self._path_sprite
+        blit_list = []
         for y in range(start_y, end_y):
             row = self.map_data[y]
+            screen_y = y * self.tile_size - camera_offset[1]
             for x in range(start_x, min(end_x, len(row))):
-                tile = row[x]
-                pos = (x * self.tile_size - camera_offset[0],
-                       y * self.tile_size - camera_offset[1])
-                img = self.path_image if tile == 'path' else self.tile_image
-                screen.blit(img, pos)
+                pos = (x * self.tile_size - camera_offset[0], screen_y)
+                if row[x] == 'path':
+                    blit_list.append((path_sheet, pos, path_area))
+                else:
+                    blit_list.append((tile_sheet, pos, tile_area))
+        screen.blits(blit_list, doreturn=False)
 
     def draw_trees(self, screen, camera_offset):
         """Draw trees layer (only visible chunks)."""
@@ -418,6 +457,7 @@ class Background:
         end_chunk_x = ((camera_offset[0] + self.screen_width) // self.tile_size) // self.chunk_size + 2
         end_chunk_y = ((camera_offset[1] + self.screen_height) // self.tile_size) // self.chunk_size + 2
 
+        blit_list = []
         for chunk_y in range(start_chunk_y, end_chunk_y):
             for chunk_x in range(start_chunk_x, end_chunk_x):
                 key = (chunk_x, chunk_y)
@@ -426,21 +466,29 @@ class Background:
                 for x, y, tree_idx in self.tree_chunks[key]:
                     pos = (x * self.tile_size - camera_offset[0] - (TREE_SIZE - TILE_SIZE) // 2,
                            y * self.tile_size - camera_offset[1] - (TREE_SIZE - TILE_SIZE) // 2)
-                    screen.blit(self.tree_images[tree_idx], pos)
+                    sheet, area = self._tree_sprites[tree_idx]
+                    blit_list.append((sheet, pos, area))
+        screen.blits(blit_list, doreturn=False)
 
     def draw_cats(self, screen, camera_offset):
         """Draw cats layer."""
+        blit_list = []
         for x, y, cat_idx in self.cat_positions:
             pos = (x * self.tile_size - camera_offset[0] - TREE_SIZE // 4,
                    y * self.tile_size - camera_offset[1] - TREE_SIZE // 4)
-            screen.blit(self.cat_images[cat_idx], pos)
+            sheet, area = self._cat_sprites[cat_idx]
+            blit_list.append((sheet, pos, area))
+        screen.blits(blit_list, doreturn=False)
 
     def draw_collectibles(self, screen, camera_offset):
         """Draw collectibles layer."""
+        blit_list = []
         for x, y, coll_idx in self.collectible_positions:
             pos = (x * self.tile_size - camera_offset[0] - COLLECTIBLE_SIZE // 2,
                    y * self.tile_size - camera_offset[1] - COLLECTIBLE_SIZE // 2)
-            screen.blit(self.collectible_images[coll_idx], pos)
+            sheet, area = self._collectible_sprites[coll_idx]
+            blit_list.append((sheet, pos, area))
+        screen.blits(blit_list, doreturn=False)
 
     def _is_in_cabin(self, world_x, world_y, cabin):
         """Check if position is inside cabin area."""
@@ -639,7 +687,7 @@ class Background:
         player.draw(screen, camera_offset)
         # Enemies drawn at same layer as player (under trees)
         if enemy_manager:
-            enemy_manager.draw(screen, camera_offset)
+            enemy_manager.draw(screen, camera_offset, self.atlas)
         self.draw_trees(screen, camera_offset)
         # Cabin walls/roof/furniture (over player when inside)
         if cabin: